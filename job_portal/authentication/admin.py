@@ -1,3 +1,8 @@
 from django.contrib import admin
+from .models import QueuedEmail
 
-# Register your models here.
+@admin.register(QueuedEmail)
+class QueuedEmailAdmin(admin.ModelAdmin):
+    list_display = ['to_email', 'subject', 'status', 'attempts', 'created_at', 'sent_at']
+    list_filter = ['status']
+    search_fields = ['to_email']
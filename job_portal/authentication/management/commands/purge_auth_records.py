@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from authentication.utils import purge_expired_auth_records
+
+
+class Command(BaseCommand):
+    help = 'Delete expired OTPs and password reset tokens and old sent emails; schedule hourly'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows deleted per transaction')
+        parser.add_argument('--dry-run', action='store_true', help='Only count what would be deleted')
+
+    def handle(self, *args, **options):
+        reclaimed = purge_expired_auth_records(batch_size=options['batch_size'], dry_run=options['dry_run'])
+        verb = 'Would delete' if options['dry_run'] else 'Deleted'
+        for name, count in reclaimed.items():
+            self.stdout.write(f"{verb} {count} {name.replace('_', ' ')}")
+        self.stdout.write(self.style.SUCCESS(f"{verb} {sum(reclaimed.values())} rows in total"))
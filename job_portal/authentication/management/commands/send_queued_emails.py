@@ -0,0 +1,23 @@
+import time
+
+from django.core.management.base import BaseCommand
+from authentication.utils import send_queued_emails
+
+
+class Command(BaseCommand):
+    help = 'Send queued emails (OTP and password reset) over one reused connection per batch'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Drain the queue once and exit')
+        parser.add_argument('--limit', type=int, default=50, help='Messages sent per batch')
+        parser.add_argument('--interval', type=float, default=1.0, help='Seconds to sleep when nothing is due')
+
+    def handle(self, *args, **options):
+        while True:
+            handled = send_queued_emails(limit=options['limit'])
+            if handled:
+                self.stdout.write(f"Handled {handled} queued emails")
+                continue
+            if options['once']:
+                break
+            time.sleep(options['interval'])
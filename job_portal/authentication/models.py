@@ -1,5 +1,7 @@
 from django.contrib.auth.models import AbstractUser, BaseUserManager
+from django.contrib.postgres.indexes import OpClass
 from django.db import models
+from django.db.models.functions import Cast, Upper
 from django.utils import timezone
 from django.conf import settings
 import random
@@ -41,9 +43,28 @@ class User(AbstractUser):
     ]
     job_role = models.CharField(max_length=10, choices=JOB_ROLE_CHOICES, default='employee')
     is_email_verified = models.BooleanField(default=False)
+    # Copied into every JWT; bumping it revokes the user's outstanding tokens
+    token_version = models.PositiveIntegerField(default=0)
     
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['first_name', 'last_name']
+
+    class Meta(AbstractUser.Meta):
+        # Match the UPPER(col::text) LIKE 'prefix%' that __istartswith generates on PostgreSQL
+        indexes = [
+            models.Index(
+                OpClass(Upper(Cast('first_name', models.TextField())), name='text_pattern_ops'),
+                name='user_first_name_prefix_idx',
+            ),
+            models.Index(
+                OpClass(Upper(Cast('last_name', models.TextField())), name='text_pattern_ops'),
+                name='user_last_name_prefix_idx',
+            ),
+        ]
+
+    def revoke_tokens(self):
+        """Invalidate every token issued so far; the caller saves the user"""
+        self.token_version += 1
     
 
 
@@ -54,6 +75,12 @@ class EmailOTP(models.Model):
     expires_at = models.DateTimeField()
     is_used = models.BooleanField(default=False)
     
+    class Meta:
+        indexes = [
+            models.Index(fields=['email', 'otp']),
+            models.Index(fields=['expires_at']),
+        ]
+    
     def save(self, *args, **kwargs):
         if not self.otp:
             self.otp = str(random.randint(100000, 999999))
@@ -71,6 +98,11 @@ class PasswordResetToken(models.Model):
     expires_at = models.DateTimeField()
     used = models.BooleanField(default=False)
     
+    class Meta:
+        indexes = [
+            models.Index(fields=['expires_at']),
+        ]
+    
     def save(self, *args, **kwargs):
         if not self.token:
             self.token = str(uuid.uuid4())
@@ -80,3 +112,32 @@ class PasswordResetToken(models.Model):
     
     def is_valid(self):
         return not self.used and timezone.now() < self.expires_at
+
+class QueuedEmail(models.Model):
+    """Outgoing mail, written by request handlers and sent by the send_queued_emails worker"""
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('sending', 'Sending'),
+        ('sent', 'Sent'),
+        ('failed', 'Failed'),
+    ]
+
+    to_email = models.EmailField()
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} to {self.to_email} ({self.status})"
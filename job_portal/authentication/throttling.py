@@ -0,0 +1,80 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.throttling import BaseThrottle
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Rate limit kept in the Django cache (atomic counters with Redis; the
+    database cache's incr is a read and a write, so a few parallel requests
+    may slip through there).
+
+    Views set `throttle_scope`; AUTH_THROTTLE_RATES['<scope>_<kind>'] is a
+    (capacity, refill_seconds) pair: up to `capacity` requests in a burst and one
+    more every `refill_seconds` on average. The bucket is approximated by a
+    sliding window of capacity * refill_seconds: the current window's counter
+    plus the previous one's, weighted by how much of it still overlaps. Every
+    request is counted with cache.incr before it is checked, so parallel
+    requests cannot all see the same remaining allowance; rejected requests
+    give their count back. Subclasses choose what a bucket is keyed on.
+    """
+    kind = None
+
+    def get_ident_key(self, request):
+        raise NotImplementedError
+
+    def allow_request(self, request, view):
+        scope = getattr(view, 'throttle_scope', None)
+        rate = settings.AUTH_THROTTLE_RATES.get(f'{scope}_{self.kind}') if scope else None
+        ident = self.get_ident_key(request)
+        if rate is None or ident is None:
+            return True
+
+        capacity, refill_seconds = rate
+        window = capacity * refill_seconds
+        now = time.time()
+        index, elapsed = divmod(now, window)
+        prefix = f'throttle:{scope}:{self.kind}:{ident}'
+        key = f'{prefix}:{int(index)}'
+
+        count = self.increment(key, timeout=int(2 * window) + 1)
+        previous = cache.get(f'{prefix}:{int(index) - 1}', 0)
+        if previous * (1 - elapsed / window) + count <= capacity:
+            return True
+
+        cache.decr(key)
+        if previous and count <= capacity:
+            # Allowed again once enough of the previous window has slid out
+            self.wait_time = window * (1 - (capacity - count) / previous) - elapsed
+        else:
+            self.wait_time = window - elapsed
+        return False
+
+    def increment(self, key, timeout):
+        cache.add(key, 0, timeout)
+        try:
+            return cache.incr(key)
+        except ValueError:
+            # Expired between add and incr
+            cache.add(key, 0, timeout)
+            return cache.incr(key)
+
+    def wait(self):
+        return getattr(self, 'wait_time', None)
+
+
+class EmailTokenBucketThrottle(TokenBucketThrottle):
+    kind = 'email'
+
+    def get_ident_key(self, request):
+        email = request.data.get('email') if hasattr(request.data, 'get') else None
+        return email.strip().lower() if isinstance(email, str) and email.strip() else None
+
+
+class IPTokenBucketThrottle(TokenBucketThrottle):
+    kind = 'ip'
+
+    def get_ident_key(self, request):
+        return self.get_ident(request)
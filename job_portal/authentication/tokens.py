@@ -0,0 +1,13 @@
+from rest_framework_simplejwt.tokens import RefreshToken
+
+TOKEN_VERSION_CLAIM = 'ver'
+
+
+class VersionedRefreshToken(RefreshToken):
+    """Refresh token (and the access tokens derived from it) stamped with the user's token_version"""
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token[TOKEN_VERSION_CLAIM] = user.token_version
+        return token
@@ -1,23 +1,96 @@
-from django.core.mail import send_mail
+from datetime import timedelta
+
+from django.core.mail import EmailMessage, get_connection
 from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
 import logging
 
+from job_portal.maintenance import delete_in_batches
+from .models import EmailOTP, PasswordResetToken, QueuedEmail
+
 logger = logging.getLogger(__name__)
 
+def queue_email(to_email, subject, body):
+    """Store a message for the send_queued_emails worker; no SMTP work happens in the request"""
+    return QueuedEmail.objects.create(to_email=to_email, subject=subject, body=body)
+
 def send_otp_email(email, otp):
-    """Send OTP via email"""
+    """Queue the OTP email"""
     subject = 'OTP Verification'
     message = f'Your OTP is: {otp}. It will expire in 5 minutes.'
-    
-    try:
-        send_mail(
-            subject,
-            message,
-            settings.DEFAULT_FROM_EMAIL,
-            [email],
-            fail_silently=False,
+    queue_email(email, subject, message)
+    logger.info(f"OTP queued for {email}")
+
+def claim_emails(limit):
+    """Lock up to `limit` due messages for this worker and mark them sending"""
+    now = timezone.now()
+    stale_before = now - timedelta(seconds=getattr(settings, 'EMAIL_QUEUE_LOCK_TIMEOUT', 300))
+    with transaction.atomic():
+        emails = list(
+            QueuedEmail.objects.select_for_update(skip_locked=True)
+            .filter(status__in=['pending', 'sending'], next_attempt_at__lte=now)
+            .exclude(status='sending', locked_at__gte=stale_before)
+            .order_by('next_attempt_at', 'id')[:limit]
         )
-        logger.info(f"OTP sent to {email}")
-    except Exception as e:
-        logger.error(f"Failed to send OTP to {email}: {str(e)}")
+        for email in emails:
+            email.status = 'sending'
+            email.locked_at = now
+            email.attempts += 1
+        QueuedEmail.objects.bulk_update(emails, ['status', 'locked_at', 'attempts'])
+    return emails
+
+def retry_delay(attempts):
+    """Exponential backoff: base, 2x base, 4x base ... capped at EMAIL_QUEUE_MAX_BACKOFF"""
+    base = getattr(settings, 'EMAIL_QUEUE_BACKOFF', 30)
+    return min(base * 2 ** (attempts - 1), getattr(settings, 'EMAIL_QUEUE_MAX_BACKOFF', 3600))
+
+def send_queued_emails(limit=50):
+    """Send one batch over a single backend connection. Returns the number of messages handled."""
+    emails = claim_emails(limit)
+    if not emails:
+        return 0
+
+    max_attempts = getattr(settings, 'EMAIL_QUEUE_MAX_ATTEMPTS', 5)
+    connection = get_connection()
+    try:
+        for email in emails:
+            message = EmailMessage(email.subject, email.body, settings.DEFAULT_FROM_EMAIL, [email.to_email], connection=connection)
+            try:
+                # Opened once and kept open across the batch; a no-op while connected
+                connection.open()
+                message.send()
+            except Exception as e:
+                logger.error(f"Failed to send email {email.pk} to {email.to_email}: {str(e)}")
+                email.status = 'failed' if email.attempts >= max_attempts else 'pending'
+                email.next_attempt_at = timezone.now() + timedelta(seconds=retry_delay(email.attempts))
+                email.last_error = str(e)
+                email.save(update_fields=['status', 'next_attempt_at', 'last_error'])
+                # The server may have dropped us; start a fresh connection for the rest of the batch
+                connection.close()
+            else:
+                email.status = 'sent'
+                email.sent_at = timezone.now()
+                email.save(update_fields=['status', 'sent_at'])
+    finally:
+        connection.close()
+    return len(emails)
 
+def purge_expired_auth_records(batch_size=1000, dry_run=False):
+    """Delete spent OTPs, reset tokens and sent mail; returns {name: rows removed}"""
+    now = timezone.now()
+    token_cutoff = now - timedelta(hours=getattr(settings, 'OTP_RETENTION_HOURS', 24))
+    email_cutoff = now - timedelta(days=getattr(settings, 'EMAIL_QUEUE_RETENTION_DAYS', 7))
+    return {
+        'otps': delete_in_batches(
+            EmailOTP.objects.filter(expires_at__lt=token_cutoff), batch_size, dry_run
+        ),
+        'reset_tokens': delete_in_batches(
+            PasswordResetToken.objects.filter(Q(expires_at__lt=token_cutoff) | Q(used=True, created_at__lt=token_cutoff)),
+            batch_size, dry_run
+        ),
+        'queued_emails': delete_in_batches(
+            QueuedEmail.objects.filter(status__in=['sent', 'failed'], created_at__lt=email_cutoff), batch_size, dry_run
+        ),
+    }
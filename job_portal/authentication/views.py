@@ -2,12 +2,19 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
-from rest_framework_simplejwt.tokens import RefreshToken
+from django.db import transaction
 from .models import User, EmailOTP, PasswordResetToken
 from .serializer import *
+from .tokens import VersionedRefreshToken
+from .throttling import EmailTokenBucketThrottle, IPTokenBucketThrottle
 from .utils import send_otp_email
 
+OTP_THROTTLES = [EmailTokenBucketThrottle, IPTokenBucketThrottle]
+
 class RegisterAPI(APIView):
+    throttle_classes = OTP_THROTTLES
+    throttle_scope = 'otp_send'
+    
     def post(self, request):
         serializer = RegisterSerializer(data=request.data)
         if not serializer.is_valid():
@@ -26,6 +33,9 @@ class RegisterAPI(APIView):
         }, status=status.HTTP_201_CREATED)
 
 class VerifyRegistrationAPI(APIView):
+    throttle_classes = OTP_THROTTLES
+    throttle_scope = 'otp_verify'
+    
     def post(self, request):
         serializer = VerifyOTPSerializer(data=request.data)
         if not serializer.is_valid():
@@ -58,6 +68,9 @@ class VerifyRegistrationAPI(APIView):
             return Response({'detail': 'User not found'}, status=status.HTTP_404_NOT_FOUND)
 
 class ResendOTPAPI(APIView):
+    throttle_classes = OTP_THROTTLES
+    throttle_scope = 'otp_send'
+    
     def post(self, request):
         serializer = ResendOTPSerializer(data=request.data)
         if not serializer.is_valid():
@@ -78,7 +91,7 @@ class LoginAPI(APIView):
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
         
         user = serializer.validated_data['user']
-        refresh = RefreshToken.for_user(user)
+        refresh = VersionedRefreshToken.for_user(user)
         
         return Response({
             'access': str(refresh.access_token),
@@ -86,6 +99,9 @@ class LoginAPI(APIView):
         }, status=status.HTTP_200_OK)
 
 class ForgotPasswordRequestAPI(APIView):
+    throttle_classes = OTP_THROTTLES
+    throttle_scope = 'otp_send'
+    
     def post(self, request):
         serializer = ForgotPasswordSerializer(data=request.data)
         if not serializer.is_valid():
@@ -104,6 +120,9 @@ class ForgotPasswordRequestAPI(APIView):
             }, status=status.HTTP_400_BAD_REQUEST)
 
 class ForgotPasswordVerifyAPI(APIView):
+    throttle_classes = OTP_THROTTLES
+    throttle_scope = 'otp_verify'
+    
     def post(self, request):
         serializer = ForgotPasswordVerifySerializer(data=request.data)
         if not serializer.is_valid():
@@ -152,6 +171,7 @@ class ForgotPasswordResetAPI(APIView):
             
             user = reset_token.user
             user.set_password(serializer.validated_data['new_password'])
+            user.revoke_tokens()
             user.save()
             
             reset_token.used = True
@@ -170,15 +190,24 @@ class ChangePasswordAPI(APIView):
         if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
         
-        user = request.user
-        
-        if not user.check_password(serializer.validated_data['old_password']):
-            return Response({'detail': 'Old password is incorrect'}, status=status.HTTP_400_BAD_REQUEST)
-        
-        user.set_password(serializer.validated_data['new_password'])
-        user.save()
+        with transaction.atomic():
+            # request.user comes from the JWT user cache and may be stale; update the current row
+            user = User.objects.select_for_update().get(pk=request.user.pk)
+            
+            if not user.check_password(serializer.validated_data['old_password']):
+                return Response({'detail': 'Old password is incorrect'}, status=status.HTTP_400_BAD_REQUEST)
+            
+            user.set_password(serializer.validated_data['new_password'])
+            user.revoke_tokens()
+            user.save(update_fields=['password', 'token_version'])
         
-        return Response({'detail': 'Password changed successfully.'}, status=status.HTTP_200_OK)
+        # Other sessions are signed out; this one continues with fresh tokens
+        refresh = VersionedRefreshToken.for_user(user)
+        return Response({
+            'detail': 'Password changed successfully.',
+            'access': str(refresh.access_token),
+            'refresh': str(refresh)
+        }, status=status.HTTP_200_OK)
 
 class UserProfileAPI(APIView):
     permission_classes = [IsAuthenticated]
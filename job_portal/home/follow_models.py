@@ -1,5 +1,10 @@
 from django.db import models
 from django.conf import settings
+from django.dispatch import Signal
+
+# Sent once per bulk accept/reject with following=<user>, follower_ids=[...], accepted=<bool>;
+# the row-level post_save/post_delete receivers do not run for queryset updates
+follow_requests_resolved = Signal()
 
 class Follow(models.Model):
     STATUS_CHOICES = [
@@ -1,7 +1,9 @@
 from rest_framework import serializers
 from authentication.models import User
 from .follow_models import Follow
-from posts.models import Post
+from .models import UserProfile
+from .services import user_stat
+from job_portal.images import variant_name, variant_url
 
 class UserMinimalSerializer(serializers.ModelSerializer):
     profile_image = serializers.SerializerMethodField()
@@ -12,53 +14,40 @@ class UserMinimalSerializer(serializers.ModelSerializer):
     
     def get_profile_image(self, obj):
         try:
-            return obj.userprofile.profile_image.url if obj.userprofile.profile_image else None
+            return variant_url(obj.userprofile.profile_image, obj.userprofile.variants, 'small')
         except:
             return None
 
-class UserListSerializer(serializers.ModelSerializer):
+class UserListSerializer(serializers.Serializer):
+    """Serializes the flat rows of AllUsersListView's values() projection"""
+    id = serializers.IntegerField()
+    email = serializers.EmailField()
+    first_name = serializers.CharField()
+    last_name = serializers.CharField()
     full_name = serializers.SerializerMethodField()
+    job_role = serializers.CharField()
     followers_count = serializers.SerializerMethodField()
     following_count = serializers.SerializerMethodField()
     posts_count = serializers.SerializerMethodField()
     profile_image = serializers.SerializerMethodField()
-    location = serializers.SerializerMethodField()
-    bio = serializers.SerializerMethodField()
-    
-    class Meta:
-        model = User
-        fields = ['id', 'email', 'first_name', 'last_name', 'full_name', 'job_role', 
-                 'followers_count', 'following_count', 'posts_count', 'profile_image', 'location', 'bio']
+    location = serializers.CharField(source='userprofile__location', allow_null=True)
+    bio = serializers.CharField(source='userprofile__bio', allow_null=True)
     
     def get_full_name(self, obj):
-        return f"{obj.first_name} {obj.last_name}".strip()
+        return f"{obj['first_name']} {obj['last_name']}".strip()
     
     def get_followers_count(self, obj):
-        return Follow.objects.filter(following=obj, status='accepted').count()
+        return obj['stats__followers_count'] or 0
     
     def get_following_count(self, obj):
-        return Follow.objects.filter(follower=obj, status='accepted').count()
+        return obj['stats__following_count'] or 0
     
     def get_posts_count(self, obj):
-        return Post.objects.filter(author=obj, is_active=True).count()
+        return obj['stats__posts_count'] or 0
     
     def get_profile_image(self, obj):
-        try:
-            return obj.userprofile.profile_image.url if obj.userprofile.profile_image else None
-        except:
-            return None
-    
-    def get_location(self, obj):
-        try:
-            return obj.userprofile.location
-        except:
-            return None
-    
-    def get_bio(self, obj):
-        try:
-            return obj.userprofile.bio
-        except:
-            return None
+        name = variant_name(obj['userprofile__profile_image'], obj['userprofile__variants'], 'small')
+        return UserProfile._meta.get_field('profile_image').storage.url(name) if name else None
 
 class FollowSerializer(serializers.ModelSerializer):
     follower = UserMinimalSerializer(read_only=True)
@@ -84,16 +73,35 @@ class UserNetworkSerializer(serializers.ModelSerializer):
         return f"{obj.first_name} {obj.last_name}".strip()
     
     def get_followers_count(self, obj):
-        return Follow.objects.filter(following=obj, status='accepted').count()
+        return user_stat(obj, 'followers_count')
     
     def get_following_count(self, obj):
-        return Follow.objects.filter(follower=obj, status='accepted').count()
+        return user_stat(obj, 'following_count')
     
     def get_posts_count(self, obj):
-        return Post.objects.filter(author=obj, is_active=True).count()
+        return user_stat(obj, 'posts_count')
     
     def get_profile_image(self, obj):
         try:
-            return obj.userprofile.profile_image.url if obj.userprofile.profile_image else None
+            return variant_url(obj.userprofile.profile_image, obj.userprofile.variants, 'small')
         except:
-            return None
\ No newline at end of file
+            return None
+
+class SuggestedUserSerializer(UserNetworkSerializer):
+    mutual_count = serializers.SerializerMethodField()
+    
+    class Meta(UserNetworkSerializer.Meta):
+        fields = UserNetworkSerializer.Meta.fields + ['mutual_count']
+    
+    def get_mutual_count(self, obj):
+        return self.context['mutual_counts'].get(obj.id, 0)
+
+class FollowRequestBulkSerializer(serializers.Serializer):
+    action = serializers.ChoiceField(choices=['accept', 'reject'])
+    follower_ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, max_length=1000, required=False)
+    all = serializers.BooleanField(default=False)
+    
+    def validate(self, attrs):
+        if attrs['all'] == ('follower_ids' in attrs):
+            raise serializers.ValidationError('Provide either follower_ids or all=true.')
+        return attrs
\ No newline at end of file
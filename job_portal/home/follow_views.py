@@ -3,10 +3,14 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
+from django.conf import settings
 
 from authentication.models import User
 from .follow_models import Follow
-from .follow_serializers import UserMinimalSerializer, UserNetworkSerializer
+from .models import UserStats
+from .follow_serializers import UserMinimalSerializer, UserNetworkSerializer, SuggestedUserSerializer, FollowRequestBulkSerializer
+from .services import resolve_follow_requests
+from .graph import follow_graph
 
 class FollowUserView(APIView):
     permission_classes = [IsAuthenticated]
@@ -56,9 +60,9 @@ class FollowersListView(generics.ListAPIView):
     permission_classes = [IsAuthenticated]
     
     def get_queryset(self):
-        user_id = self.kwargs['user_id']
-        follows = Follow.objects.filter(following_id=user_id, status='accepted')
-        return User.objects.filter(id__in=follows.values_list('follower_id', flat=True))
+        # Read from the table, not the follow graph, so every worker agrees with FollowCountsView
+        follower_ids = Follow.objects.filter(following_id=self.kwargs['user_id'], status='accepted').values('follower_id')
+        return User.objects.filter(id__in=follower_ids).select_related('stats', 'userprofile')
     
     def list(self, request, *args, **kwargs):
         queryset = self.get_queryset()
@@ -73,9 +77,8 @@ class FollowingListView(generics.ListAPIView):
     permission_classes = [IsAuthenticated]
     
     def get_queryset(self):
-        user_id = self.kwargs['user_id']
-        follows = Follow.objects.filter(follower_id=user_id, status='accepted')
-        return User.objects.filter(id__in=follows.values_list('following_id', flat=True))
+        following_ids = Follow.objects.filter(follower_id=self.kwargs['user_id'], status='accepted').values('following_id')
+        return User.objects.filter(id__in=following_ids).select_related('stats', 'userprofile')
     
     def list(self, request, *args, **kwargs):
         queryset = self.get_queryset()
@@ -85,16 +88,36 @@ class FollowingListView(generics.ListAPIView):
             'results': serializer.data
         })
 
+class SuggestedUsersView(APIView):
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request):
+        user = request.user
+        limit = getattr(settings, 'FOLLOW_SUGGESTIONS_LIMIT', 20)
+        # Pending requests are not in the graph, which only holds accepted follows
+        pending = Follow.objects.filter(follower=user, status='pending').values_list('following_id', flat=True)
+        suggestions = follow_graph.suggestions(user.id, user.job_role, limit=limit, exclude=set(pending))
+        mutual_counts = dict(suggestions)
+        
+        users = User.objects.filter(id__in=mutual_counts, is_active=True).select_related('stats', 'userprofile')
+        if user.job_role == 'company':
+            users = users.filter(job_role='company')
+        elif user.job_role == 'employee':
+            users = users.exclude(job_role='employee')
+        users = sorted(users, key=lambda u: (-mutual_counts[u.id], u.id))
+        
+        serializer = SuggestedUserSerializer(users, many=True, context={'mutual_counts': mutual_counts})
+        return Response({'results': serializer.data})
+
 class FollowCountsView(APIView):
     permission_classes = [IsAuthenticated]
     
     def get(self, request, user_id):
-        followers_count = Follow.objects.filter(following_id=user_id, status='accepted').count()
-        following_count = Follow.objects.filter(follower_id=user_id, status='accepted').count()
+        stats = UserStats.objects.filter(user_id=user_id).values('followers_count', 'following_count').first() or {}
         
         data = {
-            'followers': followers_count,
-            'following': following_count
+            'followers': stats.get('followers_count', 0),
+            'following': stats.get('following_count', 0)
         }
         
         return Response(data)
@@ -106,7 +129,7 @@ class FollowRequestsView(generics.ListAPIView):
     def get_queryset(self):
         # Get pending follow requests for current user
         follows = Follow.objects.filter(following=self.request.user, status='pending')
-        return User.objects.filter(id__in=follows.values_list('follower_id', flat=True))
+        return User.objects.filter(id__in=follows.values_list('follower_id', flat=True)).select_related('stats', 'userprofile')
     
     def list(self, request, *args, **kwargs):
         queryset = self.get_queryset()
@@ -143,4 +166,23 @@ class RejectFollowRequestView(APIView):
             return Response({'detail': 'No pending follow request found.'}, status=404)
         
         follow.delete()  # Remove rejected requests
-        return Response({'detail': 'Follow request rejected'}, status=200)
\ No newline at end of file
+        return Response({'detail': 'Follow request rejected'}, status=200)
+
+class BulkFollowRequestView(APIView):
+    permission_classes = [IsAuthenticated]
+    
+    def post(self, request):
+        serializer = FollowRequestBulkSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        accept = serializer.validated_data['action'] == 'accept'
+        
+        follower_ids = resolve_follow_requests(
+            request.user, serializer.validated_data.get('follower_ids'), accept=accept
+        )
+        if not follower_ids:
+            return Response({'detail': 'No pending follow request found.'}, status=404)
+        
+        return Response({
+            'detail': f"{len(follower_ids)} follow requests {'accepted' if accept else 'rejected'}",
+            'follower_ids': follower_ids
+        }, status=200)
\ No newline at end of file
@@ -0,0 +1,194 @@
+import threading
+import time
+from collections import defaultdict
+from typing import NamedTuple
+
+import numpy as np
+from django.conf import settings
+
+from job_portal.snapshots import SnapshotIndex
+
+ROLES = ('employee', 'employer', 'company')
+ROLE_CODES = {role: code for code, role in enumerate(ROLES)}
+UNKNOWN_ROLE = -1
+EMPTY = np.empty(0, dtype=np.int64)
+
+
+def can_follow(follower_role, following_role):
+    """The role rules enforced by FollowUserView"""
+    if follower_role == 'company':
+        return following_role == 'company'
+    if follower_role == 'employee':
+        return following_role != 'employee'
+    return True
+
+
+class CSR:
+    """Adjacency lists packed into two arrays: the neighbours of node i are indices[indptr[i]:indptr[i + 1]]"""
+
+    def __init__(self, sources, targets, n_nodes):
+        order = np.argsort(sources, kind='stable')
+        self.indices = targets[order]
+        self.indptr = np.zeros(n_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=n_nodes), out=self.indptr[1:])
+
+    def row(self, node):
+        return self.indices[self.indptr[node]:self.indptr[node + 1]]
+
+
+class GraphSnapshot(NamedTuple):
+    """One build of the graph; the id array and the CSR always come from the same build"""
+    user_ids: np.ndarray
+    roles: np.ndarray
+    following: CSR
+
+    def node(self, user_id):
+        i = np.searchsorted(self.user_ids, user_id)
+        if i < len(self.user_ids) and self.user_ids[i] == user_id:
+            return i
+        return None
+
+    def following_of(self, user_id):
+        node = self.node(user_id)
+        if node is None:
+            return EMPTY
+        return self.user_ids[self.following.row(node)]
+
+    def role_of(self, user_ids):
+        if not len(self.user_ids):
+            return np.full(len(user_ids), UNKNOWN_ROLE, dtype=np.int8)
+        nodes = np.minimum(np.searchsorted(self.user_ids, user_ids), len(self.user_ids) - 1)
+        found = self.user_ids[nodes] == user_ids
+        return np.where(found, self.roles[nodes], UNKNOWN_ROLE)
+
+
+class Overlay:
+    """Edge changes since a build, indexed by follower so a lookup touches one user's changes"""
+
+    def __init__(self):
+        self.added = defaultdict(set)
+        self.removed = defaultdict(set)
+        self.size = 0
+
+    def _move(self, follower_id, following_id, into, out_of):
+        others = out_of.get(follower_id)
+        if others:
+            others.discard(following_id)
+            if not others:
+                del out_of[follower_id]
+        into[follower_id].add(following_id)
+        self.size += 1
+
+    def add(self, follower_id, following_id):
+        self._move(follower_id, following_id, self.added, self.removed)
+
+    def remove(self, follower_id, following_id):
+        self._move(follower_id, following_id, self.removed, self.added)
+
+    def changes(self, user_id):
+        """Copies of (added, removed) followee ids for one user"""
+        return set(self.added.get(user_id, ())), set(self.removed.get(user_id, ()))
+
+
+class FollowGraph(SnapshotIndex):
+    """
+    Accepted follows held in memory as CSR arrays, follower to followees.
+
+    Users are mapped to dense node numbers through a sorted id array, so a
+    lookup is a binary search plus an array slice. Follow/unfollow signals are
+    recorded in an overlay layered over the arrays; the arrays are rebuilt in the
+    background when the overlay grows past FOLLOW_GRAPH_MAX_DELTA or after
+    FOLLOW_GRAPH_TTL, which is also how changes made by other processes arrive.
+    Changes made while a build runs are recorded again for the next overlay, so
+    none are lost when the new arrays are swapped in. That lag is fine for
+    suggestions; follower and following lists are read from the Follow table.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+        self.overlay = Overlay()
+        self.next_overlay = None
+
+    def is_stale(self):
+        ttl = getattr(settings, 'FOLLOW_GRAPH_TTL', 600)
+        max_delta = getattr(settings, 'FOLLOW_GRAPH_MAX_DELTA', 10000)
+        return time.monotonic() - self.built_at > ttl or self.overlay.size > max_delta
+
+    def load(self):
+        from authentication.models import User
+        from .follow_models import Follow
+
+        with self.lock:
+            self.next_overlay = Overlay()
+
+        users = User.objects.order_by('id').values_list('id', 'job_role')
+        rows = list(users.iterator(chunk_size=5000))
+        user_ids = np.fromiter((user_id for user_id, _ in rows), dtype=np.int64, count=len(rows))
+        roles = np.fromiter((ROLE_CODES.get(role, UNKNOWN_ROLE) for _, role in rows), dtype=np.int8, count=len(rows))
+
+        edges = Follow.objects.filter(status='accepted').values_list('follower_id', 'following_id')
+        pairs = np.array(list(edges.iterator(chunk_size=5000)), dtype=np.int64).reshape(-1, 2)
+        # Both ends exist in the user list unless a user was created mid-build; drop those edges
+        known = np.isin(pairs, user_ids).all(axis=1)
+        followers = np.searchsorted(user_ids, pairs[known, 0])
+        following = np.searchsorted(user_ids, pairs[known, 1])
+
+        return GraphSnapshot(user_ids, roles, CSR(followers, following, len(user_ids)))
+
+    def publish(self, snapshot):
+        with self.lock:
+            super().publish(snapshot)
+            self.overlay, self.next_overlay = self.next_overlay or Overlay(), None
+
+    def add_edge(self, follower_id, following_id):
+        with self.lock:
+            for overlay in filter(None, (self.overlay, self.next_overlay)):
+                overlay.add(follower_id, following_id)
+
+    def remove_edge(self, follower_id, following_id):
+        with self.lock:
+            for overlay in filter(None, (self.overlay, self.next_overlay)):
+                overlay.remove(follower_id, following_id)
+
+    def view(self):
+        """The current (snapshot, overlay) pair; use one pair for all lookups of a request"""
+        self.get_snapshot()
+        with self.lock:
+            return self.snapshot, self.overlay
+
+    def _following(self, view, user_id):
+        snapshot, overlay = view
+        ids = snapshot.following_of(user_id)
+        with self.lock:
+            added, removed = overlay.changes(user_id)
+        if removed:
+            ids = ids[~np.isin(ids, list(removed))]
+        if added:
+            ids = np.union1d(ids, list(added))
+        return ids
+
+    def suggestions(self, user_id, role, limit=20, exclude=()):
+        """Friends of friends ranked by how many of the user's followees follow them: [(user_id, mutual_count)]"""
+        view = self.view()
+        followees = self._following(view, user_id)
+        if not len(followees):
+            return []
+        candidates = np.concatenate([self._following(view, f) for f in followees])
+        if not len(candidates):
+            return []
+        candidates, counts = np.unique(candidates, return_counts=True)
+
+        keep = ~np.isin(candidates, followees) & (candidates != user_id)
+        if exclude:
+            keep &= ~np.isin(candidates, list(exclude))
+        # Unknown roles (users newer than the arrays) are checked again when the rows are loaded
+        allowed = np.array([code == UNKNOWN_ROLE or can_follow(role, ROLES[code]) for code in range(-1, len(ROLES))])
+        keep &= allowed[view[0].role_of(candidates) + 1]
+
+        candidates, counts = candidates[keep], counts[keep]
+        order = np.lexsort((candidates, -counts))[:limit]
+        return [(int(candidates[i]), int(counts[i])) for i in order]
+
+
+follow_graph = FollowGraph()
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from home.services import reconcile_all_user_stats, reconcile_user_stats
+
+
+class Command(BaseCommand):
+    help = 'Recompute follower, following and post counters from the source tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument('user_ids', nargs='*', type=int, help='Only reconcile these users')
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        if options['user_ids']:
+            reconcile_user_stats(options['user_ids'])
+            total = len(options['user_ids'])
+        else:
+            total = reconcile_all_user_stats(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Reconciled counters for {total} users"))
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.8 on 2026-10-18 17:47
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_user_stats(apps, schema_editor):
+    User = apps.get_model('authentication', 'User')
+    Follow = apps.get_model('home', 'Follow')
+    Post = apps.get_model('posts', 'Post')
+    UserStats = apps.get_model('home', 'UserStats')
+
+    accepted = Follow.objects.filter(status='accepted')
+    followers = dict(accepted.values_list('following_id').annotate(n=Count('id')))
+    following = dict(accepted.values_list('follower_id').annotate(n=Count('id')))
+    posts = dict(Post.objects.filter(is_active=True).values_list('author_id').annotate(n=Count('id')))
+
+    UserStats.objects.bulk_create(
+        (
+            UserStats(
+                user_id=user_id,
+                followers_count=followers.get(user_id, 0),
+                following_count=following.get(user_id, 0),
+                posts_count=posts.get(user_id, 0),
+            )
+            for user_id in User.objects.values_list('id', flat=True).iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0005_alter_user_job_role'),
+        ('home', '0016_alter_companyprofile_company_email'),
+        ('posts', '0007_post_post_feed_idx_post_post_author_feed_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('followers_count', models.PositiveIntegerField(default=0)),
+                ('following_count', models.PositiveIntegerField(default=0)),
+                ('posts_count', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(backfill_user_stats, migrations.RunPython.noop),
+    ]
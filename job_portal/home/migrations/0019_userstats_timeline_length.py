@@ -0,0 +1,33 @@
+# Generated by Django 5.2.8 on 2026-10-18 18:38
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_timeline_lengths(apps, schema_editor):
+    TimelineEntry = apps.get_model('posts', 'TimelineEntry')
+    UserStats = apps.get_model('home', 'UserStats')
+
+    lengths = (
+        TimelineEntry.objects.filter(user_id=OuterRef('user_id')).order_by()
+        .values('user_id').annotate(n=Count('id')).values('n')
+    )
+    UserStats.objects.update(timeline_length=Coalesce(Subquery(lengths), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0018_companyprofile_variants_userprofile_variants'),
+        ('posts', '0009_timelineentry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userstats',
+            name='timeline_length',
+            field=models.PositiveIntegerField(db_index=True, default=0),
+        ),
+        migrations.RunPython(count_timeline_lengths, migrations.RunPython.noop),
+    ]
@@ -9,6 +9,7 @@ class UserProfile(models.Model):
     
     # Shared fields
     profile_image = models.ImageField(upload_to='profile_images/', null=True, blank=True)
+    variants = models.JSONField(default=dict, blank=True)  # resized copies of profile_image, see job_portal.images
     phone = models.CharField(max_length=20, null=True, blank=True)
     location = models.CharField(max_length=255, null=True, blank=True)
     bio = models.TextField(null=True, blank=True)
@@ -38,6 +39,7 @@ class CompanyProfile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE)
 
     company_logo = models.ImageField(upload_to='company_logos/', null=True, blank=True)
+    variants = models.JSONField(default=dict, blank=True)  # resized copies of company_logo, see job_portal.images
     company_name = models.CharField(max_length=255)
     company_email = models.EmailField(null=True, blank=True)  # Optional, will use user.email if not provided
     company_phone = models.CharField(max_length=20)
@@ -50,4 +52,16 @@ class CompanyProfile(models.Model):
         return self.company_email or self.user.email
     
     def str(self):
-        return self.company_name
\ No newline at end of file
+        return self.company_name
+
+# Denormalized counters for user cards, kept current by home.signals
+class UserStats(models.Model):
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='stats')
+    followers_count = models.PositiveIntegerField(default=0)
+    following_count = models.PositiveIntegerField(default=0)
+    posts_count = models.PositiveIntegerField(default=0)
+    # Home timeline length, counted up as entries are delivered so trim_timelines only visits long ones
+    timeline_length = models.PositiveIntegerField(default=0, db_index=True)
+
+    def __str__(self):
+        return f"Stats for {self.user.email}"
@@ -0,0 +1,99 @@
+from django.db import transaction
+from django.db.models import Count, F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+from authentication.models import User
+from posts.models import Post
+from .follow_models import Follow, follow_requests_resolved
+from .models import UserStats
+
+
+def adjust_user_stats(user_id, **deltas):
+    """Apply counter deltas, e.g. adjust_user_stats(5, followers_count=1).
+
+    Rows are created with the user and backfilled by reconcile_user_stats, so a
+    missing row is left for the reconcile command rather than created here.
+    Counters stop at zero: post_delete also fires for a row another request
+    already deleted, so the same decrement can arrive twice.
+    """
+    UserStats.objects.filter(user_id=user_id).update(
+        **{field: Greatest(F(field) + delta, 0) for field, delta in deltas.items()}
+    )
+
+
+def reconcile_user_stats(user_ids):
+    """Recompute counters for the given users with one grouped query per counter"""
+    user_ids = list(user_ids)
+    followers = dict(
+        Follow.objects.filter(following_id__in=user_ids, status='accepted')
+        .values_list('following_id').annotate(n=Count('id'))
+    )
+    following = dict(
+        Follow.objects.filter(follower_id__in=user_ids, status='accepted')
+        .values_list('follower_id').annotate(n=Count('id'))
+    )
+    posts = dict(
+        Post.objects.filter(author_id__in=user_ids, is_active=True)
+        .values_list('author_id').annotate(n=Count('id'))
+    )
+    UserStats.objects.bulk_create(
+        [
+            UserStats(
+                user_id=user_id,
+                followers_count=followers.get(user_id, 0),
+                following_count=following.get(user_id, 0),
+                posts_count=posts.get(user_id, 0),
+            )
+            for user_id in user_ids
+        ],
+        update_conflicts=True,
+        unique_fields=['user'],
+        update_fields=['followers_count', 'following_count', 'posts_count'],
+    )
+
+
+def reconcile_all_user_stats(batch_size=1000):
+    """Rebuild every user's counters in batches; returns the number of users processed"""
+    total = 0
+    batch = []
+    for user_id in User.objects.order_by('id').values_list('id', flat=True).iterator(chunk_size=batch_size):
+        batch.append(user_id)
+        if len(batch) >= batch_size:
+            reconcile_user_stats(batch)
+            total += len(batch)
+            batch = []
+    if batch:
+        reconcile_user_stats(batch)
+        total += len(batch)
+    return total
+
+
+def user_stat(user, field):
+    """Read a counter from a user loaded with select_related('stats')"""
+    try:
+        return getattr(user.stats, field)
+    except UserStats.DoesNotExist:
+        return 0
+
+
+def resolve_follow_requests(user, follower_ids=None, accept=True):
+    """Accept or reject the user's pending follow requests (all of them when follower_ids is None).
+
+    The rows change with one UPDATE or DELETE, then follow_requests_resolved is
+    sent once so counters, timelines and notifications are updated in bulk.
+    Returns the follower ids that were resolved.
+    """
+    with transaction.atomic():
+        pending = Follow.objects.filter(following=user, status='pending')
+        if follower_ids is not None:
+            pending = pending.filter(follower_id__in=follower_ids)
+        follower_ids = list(pending.select_for_update().values_list('follower_id', flat=True))
+        if not follower_ids:
+            return []
+        pending = Follow.objects.filter(following=user, status='pending', follower_id__in=follower_ids)
+        if accept:
+            pending.update(status='accepted', updated_at=timezone.now())
+        else:
+            pending.delete()
+        follow_requests_resolved.send(sender=Follow, following=user, follower_ids=follower_ids, accepted=accept)
+    return follower_ids
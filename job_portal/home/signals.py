@@ -0,0 +1,95 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.db import transaction
+from django.db.models import F
+from django.dispatch import receiver
+from authentication.models import User
+from posts.models import Post
+from job_portal.images import queue_variants
+from .follow_models import Follow, follow_requests_resolved
+from .graph import follow_graph
+from .models import CompanyProfile, UserProfile, UserStats
+from .services import adjust_user_stats
+
+
+@receiver(post_save, sender=User)
+def create_user_stats(sender, instance, created, **kwargs):
+    if created:
+        UserStats.objects.get_or_create(user=instance)
+
+
+@receiver(pre_save, sender=Follow)
+def remember_follow_status(sender, instance, update_fields=None, **kwargs):
+    if update_fields and 'status' not in update_fields:
+        instance._previous_status = instance.status
+    elif instance.pk:
+        instance._previous_status = Follow.objects.filter(pk=instance.pk).values_list('status', flat=True).first()
+    else:
+        instance._previous_status = None
+
+
+@receiver(post_save, sender=Follow)
+def update_follow_counts_on_save(sender, instance, **kwargs):
+    was_accepted = getattr(instance, '_previous_status', None) == 'accepted'
+    is_accepted = instance.status == 'accepted'
+    if was_accepted != is_accepted:
+        delta = 1 if is_accepted else -1
+        adjust_user_stats(instance.following_id, followers_count=delta)
+        adjust_user_stats(instance.follower_id, following_count=delta)
+        update_graph = follow_graph.add_edge if is_accepted else follow_graph.remove_edge
+        edge = (instance.follower_id, instance.following_id)
+        transaction.on_commit(lambda: update_graph(*edge))
+
+
+@receiver(post_delete, sender=Follow)
+def update_follow_counts_on_delete(sender, instance, **kwargs):
+    if instance.status == 'accepted':
+        adjust_user_stats(instance.following_id, followers_count=-1)
+        adjust_user_stats(instance.follower_id, following_count=-1)
+        edge = (instance.follower_id, instance.following_id)
+        transaction.on_commit(lambda: follow_graph.remove_edge(*edge))
+
+
+@receiver(follow_requests_resolved)
+def update_follow_counts_on_bulk_accept(sender, following, follower_ids, accepted, **kwargs):
+    if accepted:
+        adjust_user_stats(following.id, followers_count=len(follower_ids))
+        UserStats.objects.filter(user_id__in=follower_ids).update(following_count=F('following_count') + 1)
+
+        def add_edges():
+            for follower_id in follower_ids:
+                follow_graph.add_edge(follower_id, following.id)
+        transaction.on_commit(add_edges)
+
+
+@receiver(pre_save, sender=Post)
+def remember_post_state(sender, instance, update_fields=None, **kwargs):
+    # Saves that only touch the like/comment counters cannot change is_active
+    if update_fields and 'is_active' not in update_fields:
+        instance._was_active = instance.is_active
+    elif instance.pk:
+        instance._was_active = Post.objects.filter(pk=instance.pk).values_list('is_active', flat=True).first()
+    else:
+        instance._was_active = None
+
+
+@receiver(post_save, sender=Post)
+def update_posts_count_on_save(sender, instance, created, **kwargs):
+    was_active = bool(getattr(instance, '_was_active', None))
+    if was_active != instance.is_active:
+        adjust_user_stats(instance.author_id, posts_count=1 if instance.is_active else -1)
+
+
+@receiver(post_delete, sender=Post)
+def update_posts_count_on_delete(sender, instance, **kwargs):
+    if instance.is_active:
+        adjust_user_stats(instance.author_id, posts_count=-1)
+
+
+@receiver(post_save, sender=UserProfile)
+def resize_profile_image(sender, instance, **kwargs):
+    queue_variants(instance, 'profile_image', 'avatar')
+
+
+@receiver(post_save, sender=CompanyProfile)
+def resize_company_logo(sender, instance, **kwargs):
+    queue_variants(instance, 'company_logo', 'avatar')
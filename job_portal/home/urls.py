@@ -1,6 +1,6 @@
 from django.urls import path
 from .views import UserProfileView, CompanyProfileView, ProfileView, DeleteProfileImageView
-from .follow_views import FollowUserView, UnfollowUserView, FollowersListView, FollowingListView, FollowCountsView, FollowRequestsView, AcceptFollowRequestView, RejectFollowRequestView
+from .follow_views import FollowUserView, UnfollowUserView, FollowersListView, FollowingListView, FollowCountsView, FollowRequestsView, AcceptFollowRequestView, RejectFollowRequestView, SuggestedUsersView, BulkFollowRequestView
 from .user_list_views import AllUsersListView
 
 urlpatterns = [
@@ -9,12 +9,14 @@ urlpatterns = [
     path('user-profile/', UserProfileView.as_view(), name='user_profile'),
     path('company-profile/', CompanyProfileView.as_view(), name='company_profile'),
     path('users/', AllUsersListView.as_view(), name='all_users'),
+    path('users/suggestions/', SuggestedUsersView.as_view(), name='suggested_users'),
     path('users/<int:user_id>/follow/', FollowUserView.as_view(), name='follow_user'),
     path('users/<int:user_id>/unfollow/', UnfollowUserView.as_view(), name='unfollow_user'),
     path('users/<int:user_id>/followers/', FollowersListView.as_view(), name='user_followers'),
     path('users/<int:user_id>/following/', FollowingListView.as_view(), name='user_following'),
     path('users/<int:user_id>/follow_counts/', FollowCountsView.as_view(), name='follow_counts'),
     path('follow-requests/', FollowRequestsView.as_view(), name='follow_requests'),
+    path('follow-requests/bulk/', BulkFollowRequestView.as_view(), name='bulk_follow_requests'),
     path('follow-requests/<int:user_id>/accept/', AcceptFollowRequestView.as_view(), name='accept_follow_request'),
     path('follow-requests/<int:user_id>/reject/', RejectFollowRequestView.as_view(), name='reject_follow_request'),
 ]
\ No newline at end of file
@@ -1,9 +1,36 @@
+from django.db.models import Q
 from rest_framework import generics
+from rest_framework.pagination import CursorPagination
 from rest_framework.permissions import IsAuthenticated
 from authentication.models import User
 from .follow_serializers import UserListSerializer
 
+# Columns the directory card needs; profile and counters come in through LEFT JOINs
+DIRECTORY_FIELDS = (
+    'id', 'email', 'first_name', 'last_name', 'job_role',
+    'stats__followers_count', 'stats__following_count', 'stats__posts_count',
+    'userprofile__profile_image', 'userprofile__variants', 'userprofile__location', 'userprofile__bio',
+)
+
+class UserDirectoryPagination(CursorPagination):
+    ordering = 'id'
+    page_size = 50
+    max_page_size = 100
+    page_size_query_param = 'page_size'
+
 class AllUsersListView(generics.ListAPIView):
-    queryset = User.objects.all()
     serializer_class = UserListSerializer
-    permission_classes = [IsAuthenticated]
\ No newline at end of file
+    permission_classes = [IsAuthenticated]
+    pagination_class = UserDirectoryPagination
+    
+    def get_queryset(self):
+        queryset = User.objects.all()
+        
+        # Prefix search on names: "jo" matches either name, "jo sm" matches first and last
+        terms = self.request.query_params.get('search', '').split()
+        if len(terms) == 1:
+            queryset = queryset.filter(Q(first_name__istartswith=terms[0]) | Q(last_name__istartswith=terms[0]))
+        elif len(terms) > 1:
+            queryset = queryset.filter(first_name__istartswith=terms[0], last_name__istartswith=' '.join(terms[1:]))
+        
+        return queryset.values(*DIRECTORY_FIELDS)
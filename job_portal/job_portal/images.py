@@ -0,0 +1,115 @@
+import posixpath
+from io import BytesIO
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db.models import Q
+from PIL import Image, ImageOps
+
+from .conditional import bump_version
+
+DEFAULT_VARIANTS = {
+    'avatar': {'small': 96, 'medium': 320},
+    'post': {'thumb': 480, 'large': 1280},
+}
+EXTENSIONS = {'WEBP': 'webp', 'JPEG': 'jpg'}
+
+
+def variant_sizes(kind):
+    return getattr(settings, 'IMAGE_VARIANTS', DEFAULT_VARIANTS)[kind]
+
+
+def has_current_variants(image, variants):
+    """Variants are keyed to the file they were made from, so a replaced upload never serves the old ones"""
+    return bool(image) and (variants or {}).get('source') == image.name
+
+
+def variant_name(name, variants, label):
+    """Storage name of the `label` variant of the file `name`, or `name` itself until that variant exists"""
+    variants = variants or {}
+    if name and variants.get('source') == name and label in variants:
+        return variants[label]['name']
+    return name
+
+
+def variant_url(image, variants, label):
+    """URL of the `label` variant of an image field, falling back to the original"""
+    return image.storage.url(variant_name(image.name, variants, label)) if image else None
+
+
+def queue_variants(instance, field, kind):
+    """Enqueue variant generation when the field's file differs from the one the variants were made from"""
+    from notifications.services import enqueue_event
+
+    image = getattr(instance, field)
+    source = instance.variants.get('source') if instance.variants else None
+    if (image.name or None) != source:
+        enqueue_event(
+            'image_uploaded',
+            model=instance._meta.label_lower, pk=instance.pk, field=field, kind=kind,
+        )
+
+
+def render_variant(original, max_size, image_format, quality):
+    """Downscale to fit a max_size square (never upscaling) and encode"""
+    image = original.copy()
+    image.thumbnail((max_size, max_size), Image.LANCZOS)
+    if image_format == 'JPEG' and image.mode != 'RGB':
+        background = Image.new('RGB', image.size, 'white')
+        background.paste(image, mask=image.getchannel('A') if 'A' in image.getbands() else None)
+        image = background
+    elif image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'A' in image.getbands() or 'transparency' in image.info else 'RGB')
+    options = {'method': 4} if image_format == 'WEBP' else {'optimize': True, 'progressive': True}
+    buffer = BytesIO()
+    image.save(buffer, image_format, quality=quality, **options)
+    return image.size, buffer.getvalue()
+
+
+def generate_variants(image, kind):
+    """Write the variants of an image field's file to its storage; returns the JSON to keep on the row"""
+    image_format = getattr(settings, 'IMAGE_VARIANT_FORMAT', 'WEBP')
+    quality = getattr(settings, 'IMAGE_VARIANT_QUALITY', 80)
+    stem = posixpath.splitext(posixpath.basename(image.name))[0]
+    directory = posixpath.join(posixpath.dirname(image.name), 'variants')
+
+    with image.open('rb') as f, Image.open(f) as original:
+        original = ImageOps.exif_transpose(original)
+        variants = {'source': image.name}
+        for label, max_size in variant_sizes(kind).items():
+            (width, height), data = render_variant(original, max_size, image_format, quality)
+            name = posixpath.join(directory, f'{stem}_{label}.{EXTENSIONS[image_format]}')
+            name = image.storage.save(name, ContentFile(data))
+            variants[label] = {'name': name, 'width': width, 'height': height}
+    return variants
+
+
+def delete_variants(storage, variants):
+    for label, variant in (variants or {}).items():
+        if label != 'source':
+            storage.delete(variant['name'])
+
+
+def build_image_variants(event):
+    """Outbox handler for image_uploaded: (re)build the variants of one image field"""
+    payload = event.payload
+    model = apps.get_model(payload['model'])
+    field = payload['field']
+    instance = model.objects.filter(pk=payload['pk']).first()
+    if instance is None:
+        return
+    image = getattr(instance, field)
+    if has_current_variants(image, instance.variants):
+        return
+
+    variants = generate_variants(image, payload['kind']) if image else {}
+    # Only store them if the upload is still the one they were made from
+    unchanged = Q(**{field: image.name}) if image else Q(**{f'{field}__isnull': True}) | Q(**{field: ''})
+    updated = model.objects.filter(unchanged, pk=instance.pk).update(variants=variants)
+    storage = image.storage
+    if updated:
+        delete_variants(storage, instance.variants)
+        bump_version('posts')
+    else:
+        delete_variants(storage, variants)
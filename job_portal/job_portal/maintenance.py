@@ -0,0 +1,26 @@
+from django.db import transaction
+
+
+def delete_in_batches(queryset, batch_size=1000, dry_run=False):
+    """Delete a queryset in primary-key order, one short transaction per batch; returns the rows removed.
+
+    Each batch reads the next `batch_size` keys after the last one and deletes
+    exactly those rows, so locks are held for one batch at a time and rows that
+    arrive meanwhile are only considered on a later run.
+    """
+    model = queryset.model
+    deleted = 0
+    last_pk = None
+    while True:
+        batch = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        pks = list(batch.order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not pks:
+            return deleted
+        last_pk = pks[-1]
+        if dry_run:
+            deleted += len(pks)
+            continue
+        # A regular delete keeps on_delete handling and the model's delete signals;
+        # for models without either it is still a single DELETE per batch
+        with transaction.atomic():
+            deleted += model.objects.filter(pk__in=pks).delete()[1].get(model._meta.label, 0)
@@ -0,0 +1,135 @@
+import base64
+import hashlib
+import json
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Newest-first keyset pagination on (created_at, id).
+
+    The cursor is an opaque token holding the (created_at, id) of the last row
+    served, so every page is a single index range scan no matter how deep the
+    client scrolls, and rows inserted meanwhile never shift the next page.
+    A single queryset ordered by FullTextSearchFilter's rank is paged on
+    (search_rank, id) instead, so ranked search results keep their order.
+    The total is only computed when asked for with ?count=true and is cached.
+    Several newest-first querysets can be merged into one stream with
+    paginate_querysets(), each read with the same cursor.
+    """
+    page_size = 20
+    max_page_size = 100
+    page_size_query_param = 'page_size'
+    cursor_query_param = 'cursor'
+    count_query_param = 'count'
+    invalid_cursor_message = 'Invalid cursor'
+    rank_field = 'search_rank'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self.paginate_querysets([queryset], request, view)
+
+    def paginate_querysets(self, querysets, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if request.query_params.get(self.count_query_param) == 'true':
+            self.total_count = sum(self.get_total_count(queryset) for queryset in querysets)
+        else:
+            self.total_count = None
+
+        self.key_field = self.get_key_field(querysets)
+        cursor = self.decode_cursor(request)
+        rows = []
+        for queryset in querysets:
+            rows.extend(self.get_rows(queryset, cursor))
+        if len(querysets) > 1:
+            # Streams may overlap; keep one copy of each row
+            rows = list({(type(obj), obj.pk): obj for obj in rows}.values())
+            rows.sort(key=lambda obj: (obj.created_at, obj.pk), reverse=True)
+
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[:self.page_size]
+        return self.page
+
+    def get_key_field(self, querysets):
+        """The column pages are keyed on besides the primary key"""
+        if len(querysets) == 1 and querysets[0].query.order_by[:1] == (f'-{self.rank_field}',):
+            return self.rank_field
+        return 'created_at'
+
+    def get_rows(self, queryset, cursor):
+        """Up to page_size + 1 rows after the cursor, one index range scan"""
+        field = self.key_field
+        if cursor is not None:
+            value, pk = cursor
+            try:
+                pk = queryset.model._meta.pk.to_python(pk)
+            except Exception:
+                raise NotFound(self.invalid_cursor_message)
+            queryset = queryset.filter(Q(**{f'{field}__lt': value}) | Q(**{field: value, 'pk__lt': pk}))
+        return list(queryset.order_by(f'-{field}', '-pk')[:self.page_size + 1])
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_total_count(self, queryset):
+        key = 'keyset-count:' + hashlib.md5(str(queryset.query).encode()).hexdigest()
+        count = cache.get(key)
+        if count is None:
+            count = queryset.count()
+            cache.set(key, count, getattr(settings, 'PAGINATION_COUNT_CACHE_TIMEOUT', 60))
+        return count
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+        try:
+            value, pk = json.loads(base64.urlsafe_b64decode(token.encode()))
+            value = float(value) if self.key_field == self.rank_field else parse_datetime(value)
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+        if value is None:
+            raise NotFound(self.invalid_cursor_message)
+        return value, pk
+
+    def encode_cursor(self, obj):
+        value = getattr(obj, self.key_field)
+        value = json.dumps([value if self.key_field == self.rank_field else value.isoformat(), str(obj.pk)])
+        return base64.urlsafe_b64encode(value.encode()).decode()
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.page[-1]))
+
+    def get_paginated_response(self, data):
+        fields = [('next', self.get_next_link())]
+        if self.total_count is not None:
+            fields.append(('total_count', self.total_count))
+        fields.append(('results', data))
+        return Response(OrderedDict(fields))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'total_count': {'type': 'integer'},
+                'results': schema,
+            },
+        }
@@ -0,0 +1,41 @@
+from django.contrib.auth import get_user_model
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F, FloatField, Q
+from django.db.models.functions import Cast
+from rest_framework.filters import SearchFilter
+
+
+class FullTextSearchFilter(SearchFilter):
+    """
+    ?search= backed by a PostgreSQL tsvector column and its GIN index.
+
+    Views set `search_vector_field` to the tsvector column and may set
+    `search_person_field` to a user foreign key, so that a search for someone's
+    first or last name still finds their rows through the indexed name prefix
+    lookup. Matches are ordered by rank unless the client chose an ordering.
+    """
+    search_config = 'english'
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+
+        vector_field = getattr(view, 'search_vector_field', 'search_vector')
+        query = SearchQuery(' '.join(terms), search_type='websearch', config=self.search_config)
+        condition = Q(**{vector_field: query})
+
+        person_field = getattr(view, 'search_person_field', None)
+        if person_field:
+            people = get_user_model().objects.filter(
+                Q(first_name__istartswith=terms[0]) | Q(last_name__istartswith=terms[0])
+            )
+            condition |= Q(**{f'{person_field}__in': people.values('id')})
+
+        queryset = queryset.filter(condition)
+        if 'ordering' not in request.query_params:
+            # ts_rank is a real; as double precision the value read back is exact, so a
+            # KeysetPagination cursor on it compares equal to the row it came from
+            rank = Cast(SearchRank(F(vector_field), query), FloatField())
+            queryset = queryset.annotate(search_rank=rank).order_by('-search_rank', '-pk')
+        return queryset
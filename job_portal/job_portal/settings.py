@@ -39,6 +39,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'corsheaders',
     'authentication',
     'home',
@@ -95,6 +96,30 @@ DATABASES = {
 }
 
 
+# Cache
+# Counters, version stamps and cached aggregates live here, and every process
+# (web workers, process_outbox) must see the same ones: a stamp bumped in one
+# process and not another would keep answering 304 for stale data. Without
+# REDIS_URL the database holds them (python manage.py createcachetable).
+
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'django_cache',
+            # Culling a version stamp only costs one refetch, but keep it rare
+            'OPTIONS': {'MAX_ENTRIES': 100000},
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -142,10 +167,13 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'authentication.backends.CachedJWTAuthentication',
     ]
 }
 
+# Seconds an optional ?count=true total is reused by keyset-paginated lists
+PAGINATION_COUNT_CACHE_TIMEOUT = 60
+
 from datetime import timedelta
 
 AUTH_USER_MODEL = 'authentication.User'
@@ -157,7 +185,7 @@ SIMPLE_JWT = {
 }
 
 # email settings for gmail
-EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+EMAIL_BACKEND = os.environ.get('EMAIL_BACKEND', 'django.core.mail.backends.smtp.EmailBackend')
 EMAIL_HOST = 'smtp.gmail.com'
 EMAIL_PORT = 587
 EMAIL_USE_TLS = True
@@ -172,3 +200,76 @@ CORS_ALLOWED_ORIGINS = [
 ]
 
 CORS_ALLOW_CREDENTIALS = True
+
+# Outbox worker (python manage.py process_outbox)
+OUTBOX_MAX_ATTEMPTS = 5
+OUTBOX_LOCK_TIMEOUT = 300  # seconds before a claimed event is considered abandoned
+
+# Skill-based job recommendations (jobs.recommendations.SkillIndex)
+RECOMMENDATION_INDEX_TTL = 3600  # background rebuild interval, picks up new skills and changes made by other processes
+RECOMMENDATION_MIN_REBUILD_INTERVAL = 60  # earliest rebuild after a query with a skill the index has no column for
+
+# Publisher dashboard counters (jobs.services.publisher_job_stats); invalidated by signals
+JOB_STATS_CACHE_TIMEOUT = 300
+
+# Server-sent events (GET /api/notifications/stream/); Redis fans events out across processes
+if os.environ.get('REDIS_URL'):
+    NOTIFICATION_BROKER = 'notifications.broker.RedisBroker'
+    NOTIFICATION_BROKER_URL = os.environ['REDIS_URL']
+else:
+    NOTIFICATION_BROKER = 'notifications.broker.LocalBroker'
+NOTIFICATION_STREAM_HEARTBEAT = 15  # seconds between keep-alive comments on idle streams
+
+# Notification badge: personal unread counts live on NotificationState, broadcast counts in the cache
+UNREAD_BROADCAST_CACHE_TIMEOUT = 300
+
+# Like/comment aggregation (notifications.services.record_actor_notification)
+NOTIFICATION_AGGREGATION_WINDOW = 86400  # likes/comments on one post collapse into one unread row for this long
+NOTIFICATION_LATEST_ACTORS = 3
+
+# Retention (python manage.py purge_notifications)
+NOTIFICATION_RETENTION_DAYS = 90  # read notifications only; unread ones are kept
+BROADCAST_RETENTION_DAYS = 90
+OUTBOX_RETENTION_DAYS = 7
+
+# Email queue worker (python manage.py send_queued_emails)
+EMAIL_QUEUE_MAX_ATTEMPTS = 5
+EMAIL_QUEUE_BACKOFF = 30  # seconds before the first retry, doubled on each further failure
+EMAIL_QUEUE_MAX_BACKOFF = 3600
+EMAIL_QUEUE_LOCK_TIMEOUT = 300
+
+# Token buckets for the OTP endpoints (authentication.throttling): (burst capacity, seconds per extra request)
+AUTH_THROTTLE_RATES = {
+    'otp_send_email': (3, 60),
+    'otp_send_ip': (20, 30),
+    'otp_verify_email': (5, 60),
+    'otp_verify_ip': (30, 10),
+}
+
+# Retention (python manage.py purge_auth_records)
+OTP_RETENTION_HOURS = 24  # expired or used OTPs and reset tokens are kept this long for auditing
+EMAIL_QUEUE_RETENTION_DAYS = 7
+
+# authentication.backends.CachedJWTAuthentication: per-process user cache
+AUTH_USER_CACHE_TTL = 30  # seconds; bounds how long other processes honour a revoked token or inactive user
+AUTH_USER_CACHE_SIZE = 10000
+
+# Home timeline (GET /api/posts/timeline/), filled by the post_created outbox handler
+TIMELINE_MAX_LENGTH = 800
+TIMELINE_TRIM_SLACK = 50  # entries allowed past the maximum before trim_timelines cuts a timeline
+TIMELINE_FANOUT_MAX_FOLLOWERS = 5000  # posts by authors with more followers are merged in at read time
+TIMELINE_FANOUT_BATCH_SIZE = 1000
+TIMELINE_BACKFILL = 20  # recent posts copied into a timeline when a follow is accepted
+
+# In-memory follow graph (home.graph.FollowGraph): "people you may know"
+FOLLOW_GRAPH_TTL = 600  # full rebuild interval, picks up follows made by other processes
+FOLLOW_GRAPH_MAX_DELTA = 10000  # signal-applied edge changes kept beside the arrays before a rebuild
+FOLLOW_SUGGESTIONS_LIMIT = 20
+
+# Resized copies of uploaded images (job_portal.images), built by the outbox worker
+IMAGE_VARIANTS = {
+    'avatar': {'small': 96, 'medium': 320},  # feed authors and comments / profile cards
+    'post': {'thumb': 480, 'large': 1280},  # multi-image grids / single images
+}
+IMAGE_VARIANT_FORMAT = 'WEBP'  # or 'JPEG'
+IMAGE_VARIANT_QUALITY = 80
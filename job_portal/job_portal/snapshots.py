@@ -0,0 +1,60 @@
+import logging
+import threading
+import time
+
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotIndex:
+    """
+    Base for in-process indexes built from the database.
+
+    Readers use `self.snapshot`, an immutable value replaced as a whole, so a
+    request never sees half of an old build and half of a new one. Only the very
+    first build runs in a request; after that a stale index keeps serving its
+    current snapshot while one background thread (at most) loads the next.
+    Subclasses implement is_stale() and load().
+    """
+
+    def __init__(self):
+        self.snapshot = None
+        self.built_at = None
+        self.rebuild_lock = threading.Lock()
+
+    def is_stale(self):
+        raise NotImplementedError
+
+    def load(self):
+        """Read the database and return a new snapshot"""
+        raise NotImplementedError
+
+    def publish(self, snapshot):
+        self.snapshot = snapshot
+        self.built_at = time.monotonic()
+
+    def get_snapshot(self):
+        if self.snapshot is None:
+            with self.rebuild_lock:
+                if self.snapshot is None:
+                    self.publish(self.load())
+        elif self.is_stale() and self.rebuild_lock.acquire(blocking=False):
+            threading.Thread(target=self._rebuild, daemon=True).start()
+        return self.snapshot
+
+    def rebuild(self):
+        """Build synchronously, e.g. from a management command or shell"""
+        with self.rebuild_lock:
+            self.publish(self.load())
+
+    def _rebuild(self):
+        try:
+            self.publish(self.load())
+        except Exception:
+            logger.exception(f"Rebuilding {type(self).__name__} failed")
+            # Keep serving the old snapshot and retry after another interval
+            self.built_at = time.monotonic()
+        finally:
+            connection.close()
+            self.rebuild_lock.release()
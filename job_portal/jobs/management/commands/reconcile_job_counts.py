@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from jobs.services import reconcile_job_counts
+
+
+class Command(BaseCommand):
+    help = 'Recompute the application counter on jobs from the applications table'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--job', action='append', dest='job_ids', default=[], help='Only reconcile this job (repeatable)')
+        parser.add_argument('--publisher', action='append', dest='publisher_ids', type=int, default=[], help='Only reconcile jobs of this publisher (repeatable)')
+
+    def handle(self, *args, **options):
+        fixed = reconcile_job_counts(job_ids=options['job_ids'], publisher_ids=options['publisher_ids'])
+        self.stdout.write(self.style.SUCCESS(f"Fixed application counts on {fixed} jobs"))
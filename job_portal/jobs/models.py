@@ -1,3 +1,5 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
 from django.conf import settings
 from django.utils import timezone
@@ -25,8 +27,21 @@ class Job(models.Model):
     is_active = models.BooleanField(default=True)
     deleted_at = models.DateTimeField(null=True, blank=True)
     count=models.IntegerField(default=0)
+    # Maintained by PostgreSQL on every write; queried by FullTextSearchFilter
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('title', weight='A', config='english')
+            + SearchVector('requirments', weight='B', config='english')
+            + SearchVector('description', 'experience', weight='C', config='english')
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
-
+    class Meta:
+        indexes = [
+            GinIndex(fields=['search_vector'], name='job_search_vector_idx'),
+        ]
 
     def __str__(self):
         return f"{self.title} by {self.publisher.email}"
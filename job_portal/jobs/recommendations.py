@@ -0,0 +1,182 @@
+import re
+import threading
+import time
+
+import numpy as np
+from django.conf import settings
+
+from job_portal.snapshots import SnapshotIndex
+
+TOKEN_RE = re.compile(r"[a-z0-9+#]+(?:[.\-][a-z0-9+#]+)*")
+MAX_SKILL_WORDS = 3
+
+
+def tokenize(text):
+    return TOKEN_RE.findall((text or '').lower())
+
+
+def normalize_skill(skill):
+    """'  Machine   Learning ' -> 'machine learning', 'Node.JS' -> 'node.js'"""
+    if not isinstance(skill, str):
+        return None
+    return ' '.join(tokenize(skill)) or None
+
+
+def text_ngrams(text, max_n=MAX_SKILL_WORDS):
+    tokens = tokenize(text)
+    grams = set(tokens)
+    for n in range(2, max_n + 1):
+        grams.update(' '.join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+    return grams
+
+
+def job_text(job):
+    return ' '.join(filter(None, [job['title'], job['requirments'], job['description']]))
+
+
+class SkillIndex(SnapshotIndex):
+    """
+    In-memory job-by-skill matrix used to rank active jobs for a profile.
+
+    Columns are the normalized skills users list on their profiles; a job row holds
+    the columns whose skill appears in its title, requirements or description.
+    Rows are edited one at a time as jobs change and packed into flat sparse
+    arrays (column and row of every non-zero) on the next query, so scoring every
+    job is one pass of NumPy over the non-zeros instead of a loop over jobs.
+    Skills nobody had listed at build time have no column; a query with one marks
+    the index stale, so a background rebuild adds it within
+    RECOMMENDATION_MIN_REBUILD_INTERVAL instead of at the next scheduled one.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+        self.vocabulary = {}
+        self.rows = {}
+        self.packed = None
+        self.changes = None
+        self.unknown_skills = False
+
+    def is_stale(self):
+        ttl = getattr(settings, 'RECOMMENDATION_INDEX_TTL', 3600)
+        min_interval = getattr(settings, 'RECOMMENDATION_MIN_REBUILD_INTERVAL', 60)
+        age = time.monotonic() - self.built_at
+        return age > ttl or (self.unknown_skills and age > min_interval)
+
+    def load(self):
+        from home.models import UserProfile
+        from .models import Job
+
+        # Jobs edited while the build reads the tables are replayed onto it in publish()
+        with self.lock:
+            self.changes = {}
+            # Profiles are read below, so skills seen before this point get their columns
+            self.unknown_skills = False
+
+        vocabulary = {}
+        for skills in UserProfile.objects.exclude(skills=[]).values_list('skills', flat=True).iterator():
+            for skill in skills if isinstance(skills, list) else []:
+                skill = normalize_skill(skill)
+                if skill and skill not in vocabulary:
+                    vocabulary[skill] = len(vocabulary)
+
+        rows = {}
+        jobs = Job.objects.filter(is_active=True).values('id', 'title', 'requirments', 'description')
+        for job in jobs.iterator(chunk_size=2000):
+            rows[job['id']] = self._row(vocabulary, job)
+        return vocabulary, rows
+
+    def publish(self, snapshot):
+        vocabulary, rows = snapshot
+        with self.lock:
+            for job_id, values in (self.changes or {}).items():
+                if values is None:
+                    rows.pop(job_id, None)
+                else:
+                    rows[job_id] = self._row(vocabulary, values)
+            self.changes = None
+            self.vocabulary = vocabulary
+            self.rows = rows
+            self.packed = None
+            super().publish(snapshot)
+
+    def _row(self, vocabulary, job):
+        grams = text_ngrams(job_text(job))
+        return np.array(sorted(vocabulary[g] for g in grams if g in vocabulary), dtype=np.int32)
+
+    def upsert_job(self, job):
+        """Refresh one job's row; called from the Job post_save signal"""
+        if self.snapshot is None:
+            return
+        if not job.is_active:
+            return self.remove_job(job.id)
+        values = {'id': job.id, 'title': job.title, 'requirments': job.requirments, 'description': job.description}
+        with self.lock:
+            self.rows[job.id] = self._row(self.vocabulary, values)
+            if self.changes is not None:
+                self.changes[job.id] = values
+            self.packed = None
+
+    def remove_job(self, job_id):
+        with self.lock:
+            if self.changes is not None:
+                self.changes[job_id] = None
+            if self.rows.pop(job_id, None) is not None:
+                self.packed = None
+
+    def _pack(self):
+        with self.lock:
+            if self.packed is not None:
+                return self.packed
+            job_ids = list(self.rows)
+            lengths = np.fromiter((len(self.rows[j]) for j in job_ids), dtype=np.int64, count=len(job_ids))
+            indices = np.concatenate([self.rows[j] for j in job_ids]) if job_ids else np.empty(0, dtype=np.int32)
+            row_of = np.repeat(np.arange(len(job_ids)), lengths)
+
+            # Binary tf-idf: rarer skills weigh more; rows are L2-normalized
+            n_jobs = max(len(job_ids), 1)
+            df = np.bincount(indices, minlength=len(self.vocabulary))
+            idf = np.log((1 + n_jobs) / (1 + df)) + 1.0
+            row_norm = np.sqrt(np.bincount(row_of, weights=idf[indices] ** 2, minlength=len(job_ids)))
+
+            skill_names = sorted(self.vocabulary, key=self.vocabulary.get)
+            self.packed = (job_ids, indices, row_of, idf, row_norm, self.vocabulary, skill_names, dict(self.rows))
+            return self.packed
+
+    def recommend(self, skills, limit=20, exclude=()):
+        """Return [(job_id, score, matched_skills)] best first"""
+        skills = {s for s in map(normalize_skill, skills) if s}
+        self.get_snapshot()
+        job_ids, indices, row_of, idf, row_norm, vocabulary, skill_names, rows = self._pack()
+        if any(s not in vocabulary for s in skills):
+            self.unknown_skills = True
+            self.get_snapshot()
+
+        columns = sorted(vocabulary[s] for s in skills if s in vocabulary)
+        if not columns or not job_ids:
+            return []
+
+        query = np.zeros(len(vocabulary), dtype=np.float64)
+        query[columns] = idf[columns]
+        weights = query[indices] * idf[indices]
+        scores = np.bincount(row_of, weights=weights, minlength=len(job_ids))
+        scores /= np.where(row_norm > 0, row_norm, 1.0) * np.linalg.norm(query)
+
+        excluded = set(exclude)
+        candidates = np.flatnonzero(scores > 0)
+        candidates = candidates[np.argsort(-scores[candidates], kind='stable')]
+
+        wanted = set(columns)
+        results = []
+        for i in candidates:
+            if job_ids[i] in excluded:
+                continue
+            row = rows[job_ids[i]]
+            matched = [skill_names[c] for c in row if c in wanted]
+            results.append((job_ids[i], float(scores[i]), matched))
+            if len(results) >= limit:
+                break
+        return results
+
+
+skill_index = SkillIndex()
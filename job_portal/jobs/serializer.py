@@ -2,6 +2,7 @@ from rest_framework import serializers
 from authentication.models import User
 from .models import Job, Application
 from home.models import UserProfile
+from job_portal.images import variant_url
 
 
 class UserPublicSerializer(serializers.ModelSerializer):
@@ -78,7 +79,7 @@ class ApplicantSerializer(serializers.ModelSerializer):
     
     def get_profile_image(self, obj):
         try:
-            return obj.userprofile.profile_image.url if obj.userprofile.profile_image else None
+            return variant_url(obj.userprofile.profile_image, obj.userprofile.variants, 'medium')
         except:
             return None
     
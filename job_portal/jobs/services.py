@@ -0,0 +1,70 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F, Q
+from job_portal.conditional import bump_version
+from .models import Application, Job
+
+
+def job_stats_cache_key(publisher_id):
+    return f'job-stats:{publisher_id}'
+
+
+def publisher_job_stats(publisher_id):
+    """Dashboard counters for a publisher, cached until one of their jobs or applications changes"""
+    key = job_stats_cache_key(publisher_id)
+    stats = cache.get(key)
+    if stats is None:
+        stats = compute_job_stats(publisher_id)
+        cache.set(key, stats, getattr(settings, 'JOB_STATS_CACHE_TIMEOUT', 300))
+    return stats
+
+
+def compute_job_stats(publisher_id):
+    """All counters in one query over the publisher's jobs left-joined to their applications"""
+    by_status = {
+        status: Count('applications', filter=Q(applications__status=status))
+        for status, label in Application.STATUS_CHOICES
+    }
+    row = Job.objects.filter(publisher_id=publisher_id).aggregate(
+        total_jobs=Count('id', distinct=True),
+        active_jobs=Count('id', filter=Q(is_active=True), distinct=True),
+        total_applications=Count('applications'),
+        **by_status,
+    )
+    return {
+        'total_jobs': row['total_jobs'],
+        'active_jobs': row['active_jobs'],
+        'inactive_jobs': row['total_jobs'] - row['active_jobs'],
+        'total_applications': row['total_applications'],
+        'applications_by_status': {status: row[status] for status in by_status},
+    }
+
+
+def invalidate_job_stats(publisher_id):
+    # Deleting before COMMIT would let a concurrent poll cache the pre-commit numbers again
+    key = job_stats_cache_key(publisher_id)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+def reconcile_job_counts(job_ids=None, publisher_ids=None):
+    """Reset Job.count to the real number of applications; returns the jobs that had drifted.
+
+    One grouped query finds the jobs whose counter disagrees with their
+    applications and one bulk update writes only those rows.
+    """
+    jobs = Job.objects.all()
+    if job_ids:
+        jobs = jobs.filter(id__in=job_ids)
+    if publisher_ids:
+        jobs = jobs.filter(publisher_id__in=publisher_ids)
+
+    rows = list(
+        jobs.annotate(actual=Count('applications'))
+        .filter(~Q(count=F('actual')))
+        .values_list('id', 'publisher_id', 'actual')
+    )
+    Job.objects.bulk_update([Job(id=job_id, count=actual) for job_id, _, actual in rows], ['count'], batch_size=1000)
+    for publisher_id in {publisher_id for _, publisher_id, _ in rows}:
+        bump_version('jobs', publisher_id)
+    return len(rows)
@@ -0,0 +1,48 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from job_portal.conditional import bump_version
+from notifications.broker import publish_to_user
+from .models import Application, Job
+from .recommendations import skill_index
+from .services import invalidate_job_stats
+
+
+@receiver(post_save, sender=Job)
+def refresh_job_recommendations(sender, instance, **kwargs):
+    skill_index.upsert_job(instance)
+
+
+@receiver(post_delete, sender=Job)
+def drop_job_recommendations(sender, instance, **kwargs):
+    skill_index.remove_job(instance.id)
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def job_changed(sender, instance, **kwargs):
+    publisher_jobs_changed(instance.publisher_id)
+
+
+@receiver(post_save, sender=Application)
+def application_saved(sender, instance, created, **kwargs):
+    application_changed(instance, delta=1 if created else 0)
+
+
+@receiver(post_delete, sender=Application)
+def application_deleted(sender, instance, **kwargs):
+    application_changed(instance, delta=-1)
+
+
+def application_changed(application, delta):
+    # Looked up by id so a cascade from a deleted job does not reload the job row
+    publisher_id = Job.objects.filter(id=application.job_id).values_list('publisher_id', flat=True).first()
+    if publisher_id is None:
+        return
+    publisher_jobs_changed(publisher_id)
+    if delta:
+        publish_to_user(publisher_id, 'applications', {'job_id': application.job_id, 'delta': delta})
+
+
+def publisher_jobs_changed(publisher_id):
+    invalidate_job_stats(publisher_id)
+    bump_version('jobs', publisher_id)
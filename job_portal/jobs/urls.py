@@ -1,10 +1,11 @@
 from django.urls import path
-from .views import JobListView, JobCreateView, JobDetailView, MyJobsView, ApplyJobView, JobApplicationsView, MyApplicationsView, ApplicationDetailView, JobStatsView
+from .views import JobListView, JobCreateView, JobDetailView, MyJobsView, ApplyJobView, JobApplicationsView, MyApplicationsView, ApplicationDetailView, JobStatsView, RecommendedJobsView
 
 urlpatterns = [
     path('', JobListView.as_view(), name='job-list'),
     path('create/', JobCreateView.as_view(), name='job-create'),
     path('stats/', JobStatsView.as_view(), name='job-stats'),
+    path('recommended/', RecommendedJobsView.as_view(), name='job-recommended'),
     path('<uuid:pk>/', JobDetailView.as_view(), name='job-detail'),
     path('my-jobs/', MyJobsView.as_view(), name='my-jobs'),
     path('<uuid:job_id>/apply/', ApplyJobView.as_view(), name='apply-job'),
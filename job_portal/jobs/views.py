@@ -3,27 +3,108 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status, generics
 from rest_framework.views import APIView
-from rest_framework.filters import SearchFilter, OrderingFilter
+from rest_framework.filters import OrderingFilter
 from django.utils import timezone
 from django.shortcuts import get_object_or_404
-from django.db.models import Q
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q
 from datetime import datetime
 from .serializer import *
 from .models import Job, Application
 from home.models import UserProfile
+from job_portal.conditional import ConditionalGetMixin, get_version
+from job_portal.search import FullTextSearchFilter
+from .recommendations import skill_index
+from .services import publisher_job_stats
 from .permissions import IsPublisherRole, IsPublisherOrOwner, IsEmployee, IsJobPublisher, IsApplicantOrPublisher
 
 
 class JobListView(generics.ListAPIView):
     permission_classes = [IsAuthenticated]
-    filter_backends = [SearchFilter, OrderingFilter]
-    search_fields = ['title', 'description', 'requirments', 'experience', 'work_mode', 'publisher__first_name', 'publisher__last_name']
+    filter_backends = [FullTextSearchFilter, OrderingFilter]
+    search_person_field = 'publisher'
     ordering_fields = ['created_at', 'title', 'job_type', 'experience', 'work_mode', 'count']
-    ordering = ['-created_at']
     serializer_class = JobDetailSerializer
 
+    facet_fields = ('job_type', 'work_mode', 'experience', 'location')
+    # Choice fields also accept comma-separated values; the free-text ones can contain commas
+    comma_separated_facets = ('job_type', 'work_mode')
+
+    def get_base_queryset(self):
+        # Default ordering lives here so a ranked ?search= is not re-sorted by OrderingFilter
+        return Job.objects.filter(is_active=True).select_related('publisher').order_by('-created_at')
+
+    def get_facet_filters(self):
+        """{field: Q} for the facet values in the query, e.g. ?location=Kochi, Kerala&location=Remote&job_type=fulltime,intern"""
+        filters = {}
+        for field in self.facet_fields:
+            values = self.request.GET.getlist(field)
+            if field in self.comma_separated_facets:
+                values = [v.strip() for value in values for v in value.split(',')]
+            values = [v for v in values if v]
+            if values:
+                filters[field] = Q(**{f'{field}__in': values})
+        return filters
+
     def get_queryset(self):
-        return Job.objects.filter(is_active=True).select_related('publisher')
+        return self.get_base_queryset().filter(*self.get_facet_filters().values())
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = self.get_serializer(queryset, many=True)
+        if request.GET.get('facets') != 'true':
+            return Response(serializer.data)
+        return Response({
+            'results': serializer.data,
+            'facets': self.get_facet_counts(self.filter_queryset(self.get_base_queryset()))
+        })
+
+    def get_facet_counts(self, queryset):
+        """
+        Per-value counts for every facet from one GROUP BY over the facet columns.
+
+        Each facet is counted with every other facet filter applied but not its
+        own (a filtered Count per facet), so with ?job_type=fulltime the job_type
+        facet still shows how many jobs the other types would give.
+        """
+        filters = self.get_facet_filters()
+        counts = {}
+        for field in self.facet_fields:
+            others = [q for other, q in filters.items() if other != field]
+            counts[f'{field}_total'] = Count('id', filter=Q(*others) if others else None)
+
+        facets = {field: {} for field in self.facet_fields}
+        rows = queryset.order_by().values(*self.facet_fields).annotate(**counts)
+        for row in rows:
+            for field in self.facet_fields:
+                total = row[f'{field}_total']
+                if row[field] and total:
+                    facets[field][row[field]] = facets[field].get(row[field], 0) + total
+        return facets
+
+class RecommendedJobsView(APIView):
+    permission_classes = [IsAuthenticated, IsEmployee]
+    
+    def get(self, request):
+        skills = UserProfile.objects.filter(user=request.user).values_list('skills', flat=True).first() or []
+        try:
+            limit = min(int(request.GET.get('limit', 20)), 100)
+        except ValueError:
+            limit = 20
+        
+        applied = Application.objects.filter(applicant=request.user).values_list('job_id', flat=True)
+        matches = skill_index.recommend(skills, limit=limit, exclude=set(applied))
+        
+        jobs = Job.objects.filter(id__in=[job_id for job_id, score, matched in matches], is_active=True).select_related('publisher')
+        jobs = {job.id: job for job in jobs}
+        results = []
+        for job_id, score, matched in matches:
+            if job_id in jobs:
+                data = JobDetailSerializer(jobs[job_id]).data
+                data['match_score'] = round(score, 4)
+                data['matched_skills'] = matched
+                results.append(data)
+        return Response(results)
 
 class JobCreateView(generics.CreateAPIView):
     serializer_class = JobDetailSerializer
@@ -32,20 +113,14 @@ class JobCreateView(generics.CreateAPIView):
     def perform_create(self, serializer):
         serializer.save(publisher=self.request.user)
 
-class JobStatsView(APIView):
+class JobStatsView(ConditionalGetMixin, APIView):
     permission_classes = [IsAuthenticated, IsPublisherRole]
     
+    def get_versions(self, request):
+        return (get_version('jobs', request.user.id),)
+    
     def get(self, request):
-        user_jobs = Job.objects.filter(publisher=request.user)
-        total_jobs = user_jobs.count()
-        active_jobs = user_jobs.filter(is_active=True).count()
-        total_applications = Application.objects.filter(job__publisher=request.user).count()
-        
-        return Response({
-            'total_jobs': total_jobs,
-            'active_jobs': active_jobs,
-            'total_applications': total_applications
-        })
+        return Response(publisher_job_stats(request.user.id))
 
 class JobDetailView(generics.RetrieveUpdateDestroyAPIView):
     queryset = Job.objects.all().select_related('publisher')
@@ -68,10 +143,13 @@ class JobDetailView(generics.RetrieveUpdateDestroyAPIView):
         self.perform_destroy(instance)
         return Response({'detail': 'Job deleted successfully.'}, status=status.HTTP_200_OK)
 
-class MyJobsView(generics.ListAPIView):
+class MyJobsView(ConditionalGetMixin, generics.ListAPIView):
     serializer_class = JobDetailSerializer
     permission_classes = [IsAuthenticated, IsPublisherRole]
     
+    def get_versions(self, request):
+        return (get_version('jobs', request.user.id),)
+    
     def get_queryset(self):
         return Job.objects.filter(publisher=self.request.user).select_related('publisher').order_by('-created_at')
 
@@ -92,9 +170,13 @@ class ApplyJobView(APIView):
         
         serializer = ApplicationCreateSerializer(data=request.data)
         if serializer.is_valid():
-            serializer.save(job=job, applicant=request.user)
-            job.count += 1
-            job.save()
+            try:
+                with transaction.atomic():
+                    serializer.save(job=job, applicant=request.user)
+                    Job.objects.filter(id=job.id).update(count=F('count') + 1)
+            except IntegrityError:
+                # A concurrent request from the same applicant won the unique (job, applicant) insert
+                return Response({'detail': 'Already applied to this job'}, status=status.HTTP_400_BAD_REQUEST)
             return Response({'detail': 'Application submitted successfully'}, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
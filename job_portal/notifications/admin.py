@@ -1,8 +1,18 @@
 from django.contrib import admin
-from .models import Notification
+from .models import BroadcastNotification, Notification, OutboxEvent
 
 @admin.register(Notification)
 class NotificationAdmin(admin.ModelAdmin):
     list_display = ['notification_type', 'recipient', 'is_read', 'created_at']
     list_filter = ['is_read', 'created_at', 'notification_type']
-    search_fields = ['message', 'recipient__email']
\ No newline at end of file
+    search_fields = ['message', 'recipient__email']
+
+@admin.register(OutboxEvent)
+class OutboxEventAdmin(admin.ModelAdmin):
+    list_display = ['id', 'event_type', 'status', 'attempts', 'created_at', 'processed_at']
+    list_filter = ['status', 'event_type']
+
+@admin.register(BroadcastNotification)
+class BroadcastNotificationAdmin(admin.ModelAdmin):
+    list_display = ['notification_type', 'sender', 'message', 'created_at']
+    list_filter = ['notification_type', 'created_at']
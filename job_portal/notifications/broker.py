@@ -0,0 +1,172 @@
+import asyncio
+import json
+import logging
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+from rest_framework.utils.encoders import JSONEncoder
+
+logger = logging.getLogger(__name__)
+
+BROADCAST_CHANNEL = 'broadcast'
+
+
+def user_channel(user_id):
+    return f'user:{user_id}'
+
+
+class Subscription:
+    """Events for one connection; iterate it from the connection's event loop"""
+
+    def __init__(self, broker, channels):
+        self.broker = broker
+        self.channels = channels
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=getattr(settings, 'NOTIFICATION_STREAM_QUEUE_SIZE', 100))
+
+    def put(self, message):
+        # A client that stops reading loses events rather than growing the queue forever
+        if not self.queue.full():
+            self.queue.put_nowait(message)
+
+    async def get(self, timeout):
+        return await asyncio.wait_for(self.queue.get(), timeout)
+
+    async def close(self):
+        await self.broker.unsubscribe(self)
+
+
+class LocalBroker:
+    """
+    In-process pub/sub.
+
+    Subscribers are asyncio queues owned by the event loop serving the stream;
+    publish() is called from sync code (signals, views run in a thread) and hands
+    messages over with call_soon_threadsafe. Only reaches connections served by
+    the same process, so it suits development, tests and single-process ASGI
+    deployments; use RedisBroker when the API runs in more than one process.
+    Events are published from the web process (the outbox worker publishes none),
+    so running process_outbox alongside does not need Redis.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.subscribers = defaultdict(set)
+
+    async def subscribe(self, channels):
+        subscription = Subscription(self, channels)
+        with self.lock:
+            for channel in channels:
+                self.subscribers[channel].add(subscription)
+        return subscription
+
+    async def unsubscribe(self, subscription):
+        with self.lock:
+            for channel in subscription.channels:
+                self.subscribers[channel].discard(subscription)
+                if not self.subscribers[channel]:
+                    del self.subscribers[channel]
+
+    def publish(self, channel, message):
+        with self.lock:
+            subscriptions = list(self.subscribers.get(channel, ()))
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.put, message)
+            except RuntimeError:
+                # Loop already closed; the stream's finally block will unsubscribe it
+                pass
+
+
+class RedisBroker:
+    """
+    Pub/sub over Redis channels, for several ASGI processes and the outbox worker.
+
+    Each process keeps one Redis pubsub connection for all of its streams. A
+    channel is subscribed when the first local stream needs it and dropped with
+    the last one, and a single reader task hands each message to the queues of
+    the local subscriptions, the same way LocalBroker does.
+    """
+
+    def __init__(self):
+        import redis
+        self.url = settings.NOTIFICATION_BROKER_URL
+        self.client = redis.Redis.from_url(self.url)
+        self.loop = None
+
+    def _connect(self):
+        # asyncio connections belong to one event loop; a new loop gets its own
+        import redis.asyncio
+
+        loop = asyncio.get_running_loop()
+        if self.loop is not loop:
+            self.loop = loop
+            self.pubsub = redis.asyncio.Redis.from_url(self.url).pubsub()
+            self.channel_lock = asyncio.Lock()
+            self.subscribers = defaultdict(set)
+            self.reader = None
+
+    async def subscribe(self, channels):
+        self._connect()
+        subscription = Subscription(self, channels)
+        async with self.channel_lock:
+            new_channels = [channel for channel in channels if channel not in self.subscribers]
+            for channel in channels:
+                self.subscribers[channel].add(subscription)
+            if new_channels:
+                await self.pubsub.subscribe(*new_channels)
+        if self.reader is None:
+            self.reader = asyncio.create_task(self._read())
+        return subscription
+
+    async def unsubscribe(self, subscription):
+        async with self.channel_lock:
+            unused = []
+            for channel in subscription.channels:
+                self.subscribers[channel].discard(subscription)
+                if not self.subscribers[channel]:
+                    del self.subscribers[channel]
+                    unused.append(channel)
+            if unused:
+                await self.pubsub.unsubscribe(*unused)
+
+    async def _read(self):
+        while True:
+            try:
+                item = await self.pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+            except Exception:
+                # redis-py reconnects and resubscribes on the next read
+                logger.exception("Reading from the notification broker failed")
+                await asyncio.sleep(1)
+                continue
+            if item is None or item['type'] != 'message':
+                continue
+            message = json.loads(item['data'])
+            for subscription in list(self.subscribers.get(item['channel'].decode(), ())):
+                subscription.put(message)
+
+    def publish(self, channel, message):
+        self.client.publish(channel, json.dumps(message, cls=JSONEncoder))
+
+
+_broker = None
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        _broker = import_string(settings.NOTIFICATION_BROKER)()
+    return _broker
+
+
+def publish(channel, event, data):
+    """Send an event to stream subscribers once the current transaction commits"""
+    message = {'event': event, 'data': data}
+    transaction.on_commit(lambda: get_broker().publish(channel, message))
+
+
+def publish_to_user(user_id, event, data):
+    publish(user_channel(user_id), event, data)
@@ -0,0 +1,23 @@
+import time
+
+from django.core.management.base import BaseCommand
+from notifications.services import process_outbox
+
+
+class Command(BaseCommand):
+    help = 'Run pending outbox events (notification fan-out and other deferred work)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Drain the outbox once and exit')
+        parser.add_argument('--limit', type=int, default=100, help='Events claimed per batch')
+        parser.add_argument('--interval', type=float, default=2.0, help='Seconds to sleep when the outbox is empty')
+
+    def handle(self, *args, **options):
+        while True:
+            handled = process_outbox(limit=options['limit'])
+            if handled:
+                self.stdout.write(f"Processed {handled} outbox events")
+                continue
+            if options['once']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from notifications.services import reconcile_unread_counts
+
+
+class Command(BaseCommand):
+    help = 'Recompute the cached unread notification counters; run periodically (e.g. hourly from cron)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        fixed = reconcile_unread_counts(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Fixed unread counters for {fixed} users"))
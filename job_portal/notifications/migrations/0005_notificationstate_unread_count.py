@@ -0,0 +1,49 @@
+# Generated by Django 5.2.8 on 2026-10-18 17:59
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_notification_state(apps, schema_editor):
+    User = apps.get_model('authentication', 'User')
+    Notification = apps.get_model('notifications', 'Notification')
+    NotificationState = apps.get_model('notifications', 'NotificationState')
+
+    unread = dict(Notification.objects.filter(is_read=False).values_list('recipient_id').annotate(n=Count('id')))
+    existing = set(NotificationState.objects.values_list('user_id', flat=True))
+
+    NotificationState.objects.bulk_update(
+        [NotificationState(user_id=user_id, unread_count=unread.get(user_id, 0)) for user_id in existing],
+        ['unread_count'],
+        batch_size=1000,
+    )
+    NotificationState.objects.bulk_create(
+        (
+            NotificationState(user_id=user_id, broadcasts_read_at=date_joined, unread_count=unread.get(user_id, 0))
+            for user_id, date_joined in User.objects.values_list('id', 'date_joined').iterator()
+            if user_id not in existing
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0004_notificationstate_broadcastnotification'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notificationstate',
+            name='unread_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['recipient', 'is_read'], name='notificatio_recipie_4e3567_idx'),
+        ),
+        migrations.RunPython(backfill_notification_state, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 18:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0007_notification_actor_count_latest_actors'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='outboxevent',
+            name='event_type',
+            field=models.CharField(choices=[('job_posted', 'Job posted'), ('post_created', 'Post created')], max_length=50),
+        ),
+    ]
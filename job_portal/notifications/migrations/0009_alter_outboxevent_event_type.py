@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 18:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0008_outboxevent_post_created'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='outboxevent',
+            name='event_type',
+            field=models.CharField(choices=[('job_posted', 'Job posted'), ('post_created', 'Post created'), ('image_uploaded', 'Image uploaded')], max_length=50),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 18:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0009_alter_outboxevent_event_type'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='aggregated_since',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
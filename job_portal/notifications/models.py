@@ -19,9 +19,74 @@ class Notification(models.Model):
     object_id = models.UUIDField(null=True, blank=True)
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    # Likes and comments on the same object collapse into one row while it is unread
+    actor_count = models.PositiveIntegerField(default=1)
+    latest_actors = models.JSONField(default=list, blank=True)
+    # When the row started collecting actors; actor_count is recounted from the likes/comments since then
+    aggregated_since = models.DateTimeField(null=True, blank=True)
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['recipient', 'is_read']),
+            models.Index(fields=['recipient', '-created_at', '-id'], name='notification_inbox_idx'),
+        ]
     
     def __str__(self):
-        return f"{self.notification_type} - {self.recipient.email}"
\ No newline at end of file
+        return f"{self.notification_type} - {self.recipient.email}"
+
+class BroadcastNotification(models.Model):
+    """A notification addressed to every user, stored once and merged into each list at read time"""
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    sender = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, null=True, blank=True)
+    notification_type = models.CharField(max_length=20, choices=Notification.NOTIFICATION_TYPES, default='job')
+    message = models.CharField(max_length=255)
+    object_id = models.UUIDField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.notification_type} broadcast - {self.message}"
+
+class NotificationState(models.Model):
+    """Per-user read state: broadcasts up to broadcasts_read_at are read, unread_count caches personal unread rows"""
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, primary_key=True, related_name='notification_state')
+    broadcasts_read_at = models.DateTimeField()
+    unread_count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.user.email} read broadcasts up to {self.broadcasts_read_at}"
+
+class OutboxEvent(models.Model):
+    """Work recorded alongside a write and executed later by the outbox worker."""
+    EVENT_TYPES = (
+        ('job_posted', 'Job posted'),
+        ('post_created', 'Post created'),
+        ('image_uploaded', 'Image uploaded'),
+    )
+    STATUS_CHOICES = (
+        ('pending', 'Pending'),
+        ('processing', 'Processing'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    )
+
+    event_type = models.CharField(max_length=50, choices=EVENT_TYPES)
+    payload = models.JSONField(default=dict)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['status', 'id']),
+        ]
+
+    def __str__(self):
+        return f"{self.event_type} #{self.pk} ({self.status})"
@@ -0,0 +1,6 @@
+from job_portal.pagination import KeysetPagination
+
+
+class NotificationPagination(KeysetPagination):
+    page_size = 20
+    max_page_size = 50
@@ -3,6 +3,9 @@ from .models import Notification
 
 class NotificationSerializer(serializers.ModelSerializer):
     sender_name = serializers.CharField(source='sender.get_full_name', read_only=True)
+    # Broadcasts are serialized here too and have a single actor
+    actor_count = serializers.IntegerField(read_only=True, default=1)
+    latest_actors = serializers.ListField(read_only=True, default=list)
     
     class Meta:
         model = Notification
@@ -13,5 +16,7 @@ class NotificationSerializer(serializers.ModelSerializer):
             'message',
             'object_id',
             'is_read',
-            'created_at'
+            'created_at',
+            'actor_count',
+            'latest_actors'
         ]
\ No newline at end of file
@@ -1,21 +1,281 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from .models import Notification
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+from job_portal.conditional import bump_version, get_version
+from job_portal.images import build_image_variants
+from job_portal.maintenance import delete_in_batches
+from posts.timeline import fan_out_post
+from .broker import publish_to_user
+from .models import BroadcastNotification, Notification, NotificationState, OutboxEvent
 
 User = get_user_model()
+logger = logging.getLogger(__name__)
+
+AGGREGATED_VERBS = {
+    'like': 'liked',
+    'comment': 'commented on',
+}
+
+def enqueue_event(event_type, **payload):
+    """Record work for the outbox worker; cheap enough to call inside a request"""
+    return OutboxEvent.objects.create(event_type=event_type, payload=payload)
+
+def create_job_broadcast(job):
+    """Publish a job-posted notification as a single broadcast row.
+
+    Every user sees it through the read-time merge in NotificationListView, so a
+    job post costs the same number of writes regardless of how many users exist,
+    and it is created in the request: the stream push then leaves from the web
+    process, which LocalBroker needs to reach its connections.
+    """
+    return BroadcastNotification.objects.get_or_create(
+        notification_type='job',
+        object_id=job.id,
+        defaults={
+            'sender': job.publisher,
+            'message': f"{job.publisher.get_full_name()} posted a {job.title} job",
+        }
+    )
+
+def publish_job_broadcast(event):
+    """Outbox handler for job_posted events queued before broadcasts were created in the request"""
+    from jobs.models import Job
+
+    job = Job.objects.select_related('publisher').filter(id=event.payload['job_id']).first()
+    if job is not None:
+        create_job_broadcast(job)
+
+def notification_state(user):
+    """The user's NotificationState, created from the notifications table if it is missing"""
+    state = NotificationState.objects.filter(user=user).first()
+    if state is None:
+        state, created = NotificationState.objects.get_or_create(user=user, defaults={
+            'broadcasts_read_at': user.date_joined,
+            'unread_count': Notification.objects.filter(recipient=user, is_read=False).count(),
+        })
+    return state
 
-def create_job_posted_notifications(job):
-    """Create notifications for all users when a job is posted"""
-    users = User.objects.exclude(id=job.publisher.id)
-    notifications = [
-        Notification(
-            user=user,
-            title="New job posted",
-            message=f"{job.publisher.first_name} {job.publisher.last_name} posted a {job.title} job",
-            target_id=str(job.id)
+def adjust_unread_count(user_id, delta):
+    NotificationState.objects.filter(user_id=user_id).update(unread_count=Greatest(F('unread_count') + delta, 0))
+
+def actor_message(notification_type, actor_name, others):
+    verb = AGGREGATED_VERBS[notification_type]
+    if others == 0:
+        return f"{actor_name} {verb} your post"
+    return f"{actor_name} and {others} {'other' if others == 1 else 'others'} {verb} your post"
+
+def actor_sources():
+    from posts.models import PostComment, PostLike
+    return {'like': PostLike, 'comment': PostComment}
+
+def count_actors(notification):
+    """Distinct users who liked/commented on the object since the aggregate started, the recipient excluded"""
+    source = actor_sources()[notification.notification_type]
+    since = notification.aggregated_since or notification.created_at
+    return (
+        source.objects.filter(post_id=notification.object_id, created_at__gte=since)
+        .exclude(user_id=notification.recipient_id)
+        .values('user_id').distinct().count()
+    )
+
+def record_actor_notification(recipient, actor, notification_type, object_id, acted_at):
+    """Create a like/comment notification, or fold it into the recipient's unread one for the same object.
+
+    Rows are grouped by (recipient, type, object_id) within NOTIFICATION_AGGREGATION_WINDOW;
+    the aggregate keeps an actor count and the most recent actors, and moves to
+    the top of the list with each new actor. The count comes from the likes or
+    comments themselves, so an actor returning after others is not counted twice.
+    """
+    window = timedelta(seconds=getattr(settings, 'NOTIFICATION_AGGREGATION_WINDOW', 86400))
+    max_actors = getattr(settings, 'NOTIFICATION_LATEST_ACTORS', 3)
+    with transaction.atomic():
+        notification = (
+            Notification.objects.select_for_update()
+            .filter(
+                recipient=recipient, notification_type=notification_type, object_id=object_id,
+                is_read=False, created_at__gte=timezone.now() - window,
+            )
+            .order_by('-created_at')
+            .first()
         )
-        for user in users
+        if notification is None:
+            return Notification.objects.create(
+                recipient=recipient,
+                sender=actor,
+                notification_type=notification_type,
+                message=actor_message(notification_type, actor.get_full_name(), 0),
+                object_id=object_id,
+                latest_actors=[actor.id],
+                aggregated_since=acted_at,
+            )
+
+        actors = notification.latest_actors or [notification.sender_id]
+        notification.actor_count = max(count_actors(notification), 1)
+        notification.latest_actors = ([actor.id] + [a for a in actors if a != actor.id])[:max_actors]
+        notification.sender = actor
+        notification.message = actor_message(notification_type, actor.get_full_name(), notification.actor_count - 1)
+        notification.created_at = timezone.now()
+        notification.save(update_fields=['actor_count', 'latest_actors', 'sender', 'message', 'created_at'])
+    return notification
+
+def broadcasts_read_at(user):
+    """High-water mark for the user's broadcasts; defaults to when they joined"""
+    read_at = NotificationState.objects.filter(user=user).values_list('broadcasts_read_at', flat=True).first()
+    return read_at or user.date_joined
+
+def visible_broadcasts(user):
+    """Broadcasts published after the user joined, excluding their own"""
+    return BroadcastNotification.objects.filter(created_at__gt=user.date_joined).exclude(sender=user)
+
+def unread_broadcast_count(user, read_at=None):
+    """Cached until a broadcast is published or the user's read mark moves"""
+    read_at = read_at or broadcasts_read_at(user)
+    key = f"broadcast-unread:{user.id}:{get_version('broadcasts')}:{read_at.timestamp()}"
+    count = cache.get(key)
+    if count is None:
+        count = visible_broadcasts(user).filter(created_at__gt=read_at).count()
+        cache.set(key, count, getattr(settings, 'UNREAD_BROADCAST_CACHE_TIMEOUT', 300))
+    return count
+
+def unread_count(user):
+    """Badge count from the user's state row plus the cached broadcast count"""
+    state = notification_state(user)
+    return state.unread_count + unread_broadcast_count(user, state.broadcasts_read_at)
+
+def reconcile_unread_counts(batch_size=1000):
+    """Recount personal unread notifications for every state row; returns the rows that had drifted"""
+    fixed = 0
+    states = NotificationState.objects.order_by('user_id').values_list('user_id', 'unread_count')
+    batch = []
+    for row in states.iterator(chunk_size=batch_size):
+        batch.append(row)
+        if len(batch) >= batch_size:
+            fixed += _reconcile_unread_batch(batch)
+            batch = []
+    if batch:
+        fixed += _reconcile_unread_batch(batch)
+    return fixed
+
+def _reconcile_unread_batch(rows):
+    actual = dict(
+        Notification.objects.filter(recipient_id__in=[user_id for user_id, _ in rows], is_read=False)
+        .values_list('recipient_id').annotate(n=Count('id'))
+    )
+    drifted = [
+        NotificationState(user_id=user_id, unread_count=actual.get(user_id, 0))
+        for user_id, count in rows if actual.get(user_id, 0) != count
     ]
-    Notification.objects.bulk_create(notifications)
+    NotificationState.objects.bulk_update(drifted, ['unread_count'])
+    return len(drifted)
+
+def mark_read(user, notification_id=None):
+    """Mark one or all of the user's notifications read; returns how many were unread"""
+    notifications = Notification.objects.filter(recipient=user, is_read=False)
+    if notification_id is not None:
+        notifications = notifications.filter(id=notification_id)
+    return _mark_read(user, notifications)
+
+def mark_follow_requests_read(user, follower_ids):
+    """Mark the follow-request notifications of requests the user has answered as read"""
+    notifications = Notification.objects.filter(
+        recipient=user, notification_type='follow', sender_id__in=follower_ids, is_read=False
+    )
+    marked = _mark_read(user, notifications)
+    if marked:
+        publish_unread_count(user)
+    return marked
+
+def _mark_read(user, notifications):
+    marked = notifications.update(is_read=True)
+    if marked:
+        adjust_unread_count(user.id, -marked)
+        bump_version('notifications', user.id)
+    return marked
+
+def publish_unread_count(user):
+    publish_to_user(user.id, 'unread_count', {'unread_count': unread_count(user)})
+
+def mark_broadcasts_read(user, up_to=None):
+    """Advance the user's high-water mark; it never moves backwards"""
+    up_to = up_to or timezone.now()
+    state = notification_state(user)
+    if state.broadcasts_read_at < up_to:
+        state.broadcasts_read_at = up_to
+        state.save(update_fields=['broadcasts_read_at'])
+    bump_version('notifications', user.id)
+    publish_unread_count(user)
+
+OUTBOX_HANDLERS = {
+    'job_posted': publish_job_broadcast,
+    'post_created': fan_out_post,
+    'image_uploaded': build_image_variants,
+}
+
+def claim_events(limit):
+    """Lock up to `limit` runnable events for this worker and mark them processing"""
+    stale_before = timezone.now() - timedelta(seconds=getattr(settings, 'OUTBOX_LOCK_TIMEOUT', 300))
+    with transaction.atomic():
+        events = list(
+            OutboxEvent.objects.select_for_update(skip_locked=True)
+            .filter(status__in=['pending', 'processing'])
+            .exclude(status='processing', locked_at__gte=stale_before)
+            .order_by('id')[:limit]
+        )
+        now = timezone.now()
+        for event in events:
+            event.status = 'processing'
+            event.locked_at = now
+            event.attempts += 1
+        OutboxEvent.objects.bulk_update(events, ['status', 'locked_at', 'attempts'])
+    return events
+
+def process_outbox(limit=100):
+    """Run one batch of outbox events. Returns the number of events handled."""
+    max_attempts = getattr(settings, 'OUTBOX_MAX_ATTEMPTS', 5)
+    events = claim_events(limit)
+    for event in events:
+        try:
+            OUTBOX_HANDLERS[event.event_type](event)
+        except Exception as e:
+            logger.exception(f"Outbox event {event.pk} failed")
+            event.status = 'failed' if event.attempts >= max_attempts else 'pending'
+            event.last_error = str(e)
+            event.save(update_fields=['status', 'last_error'])
+        else:
+            event.status = 'done'
+            event.processed_at = timezone.now()
+            event.save(update_fields=['status', 'processed_at'])
+    return len(events)
+
+def purge_expired_notifications(batch_size=1000, dry_run=False):
+    """Retention job: drop old read notifications, old broadcasts and finished outbox events.
+
+    Returns {name: rows removed}. Ages come from NOTIFICATION_RETENTION_DAYS,
+    BROADCAST_RETENTION_DAYS and OUTBOX_RETENTION_DAYS. Unread notifications are
+    kept whatever their age so the unread counters stay exact.
+    """
+    now = timezone.now()
+    def cutoff(setting, default):
+        return now - timedelta(days=getattr(settings, setting, default))
+
+    notifications = Notification.objects.filter(is_read=True, created_at__lt=cutoff('NOTIFICATION_RETENTION_DAYS', 90))
+    # The delete signals bump the inbox and broadcast versions of the affected rows
+    return {
+        'notifications': delete_in_batches(notifications, batch_size, dry_run),
+        'broadcasts': delete_in_batches(
+            BroadcastNotification.objects.filter(created_at__lt=cutoff('BROADCAST_RETENTION_DAYS', 90)), batch_size, dry_run
+        ),
+        'outbox_events': delete_in_batches(
+            OutboxEvent.objects.filter(status='done', processed_at__lt=cutoff('OUTBOX_RETENTION_DAYS', 7)), batch_size, dry_run
+        ),
+    }
 
 def create_follow_request_notification(follow):
     """Create notification when someone sends a follow request"""
@@ -24,4 +284,4 @@ def create_follow_request_notification(follow):
         title="New follow request",
         message=f"{follow.follower.first_name} {follow.follower.last_name} sent you a follow request",
         target_id=str(follow.follower.id)
-    )
\ No newline at end of file
+    )
@@ -1,13 +1,22 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
-from home.follow_models import Follow
+from home.follow_models import Follow, follow_requests_resolved
 from jobs.models import Job
 from posts.models import PostLike, PostComment
-from .models import Notification
+from job_portal.conditional import bump_version
+from .broker import BROADCAST_CHANNEL, publish, publish_to_user
+from .models import BroadcastNotification, Notification, NotificationState
+from .serializers import NotificationSerializer
+from .services import adjust_unread_count, create_job_broadcast, mark_follow_requests_read, publish_unread_count, record_actor_notification
 
 User = get_user_model()
 
+@receiver(post_save, sender=User)
+def create_notification_state(sender, instance, created, **kwargs):
+    if created:
+        NotificationState.objects.get_or_create(user=instance, defaults={'broadcasts_read_at': instance.date_joined})
+
 @receiver(post_save, sender=Follow)
 def create_follow_notification(sender, instance, created, **kwargs):
     if created:
@@ -19,40 +28,56 @@ def create_follow_notification(sender, instance, created, **kwargs):
             object_id=instance.follower.id
         )
 
+@receiver(follow_requests_resolved)
+def resolve_follow_notifications(sender, following, follower_ids, **kwargs):
+    mark_follow_requests_read(following, follower_ids)
+
 @receiver(post_save, sender=Job)
 def create_job_notification(sender, instance, created, **kwargs):
     if created:
-        users = User.objects.exclude(id=instance.publisher.id)
-        notifications = [
-            Notification(
-                recipient=user,
-                sender=instance.publisher,
-                notification_type='job',
-                message=f"{instance.publisher.get_full_name()} posted a {instance.title} job",
-                object_id=instance.id
-            )
-            for user in users
-        ]
-        Notification.objects.bulk_create(notifications)
+        create_job_broadcast(instance)
 
 @receiver(post_save, sender=PostLike)
 def create_like_notification(sender, instance, created, **kwargs):
     if created and instance.user != instance.post.author:
-        Notification.objects.create(
-            recipient=instance.post.author,
-            sender=instance.user,
-            notification_type='like',
-            message=f"{instance.user.get_full_name()} liked your post",
-            object_id=instance.post.id
-        )
+        record_actor_notification(instance.post.author, instance.user, 'like', instance.post.id, instance.created_at)
 
 @receiver(post_save, sender=PostComment)
 def create_comment_notification(sender, instance, created, **kwargs):
     if created and instance.user != instance.post.author:
-        Notification.objects.create(
-            recipient=instance.post.author,
-            sender=instance.user,
-            notification_type='comment',
-            message=f"{instance.user.get_full_name()} commented on your post",
-            object_id=instance.post.id
-        )
\ No newline at end of file
+        record_actor_notification(instance.post.author, instance.user, 'comment', instance.post.id, instance.created_at)
+
+@receiver(post_save, sender=Notification)
+@receiver(post_delete, sender=Notification)
+def notification_changed(sender, instance, **kwargs):
+    bump_version('notifications', instance.recipient_id)
+
+@receiver(post_save, sender=Notification)
+def push_notification(sender, instance, created, update_fields=None, **kwargs):
+    if created:
+        if not instance.is_read:
+            adjust_unread_count(instance.recipient_id, 1)
+        publish_to_user(instance.recipient_id, 'notification', NotificationSerializer(instance).data)
+        publish_unread_count(instance.recipient)
+    elif update_fields and 'actor_count' in update_fields:
+        # An aggregate gained an actor; clients replace the row with the same id
+        publish_to_user(instance.recipient_id, 'notification', NotificationSerializer(instance).data)
+
+@receiver(post_delete, sender=Notification)
+def release_unread_count(sender, instance, **kwargs):
+    if not instance.is_read:
+        adjust_unread_count(instance.recipient_id, -1)
+
+@receiver(post_save, sender=BroadcastNotification)
+@receiver(post_delete, sender=BroadcastNotification)
+def broadcast_changed(sender, instance, **kwargs):
+    bump_version('broadcasts')
+
+@receiver(post_save, sender=BroadcastNotification)
+def push_broadcast(sender, instance, created, **kwargs):
+    if created:
+        instance.is_read = False
+        publish(BROADCAST_CHANNEL, 'broadcast', {
+            'sender_id': instance.sender_id,
+            'notification': NotificationSerializer(instance).data,
+        })
@@ -0,0 +1,73 @@
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import JsonResponse, StreamingHttpResponse
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework_simplejwt.exceptions import InvalidToken
+from authentication.backends import CachedJWTAuthentication
+from .broker import BROADCAST_CHANNEL, get_broker, user_channel
+from .services import unread_count
+
+
+def format_event(event, data):
+    return f"event: {event}\ndata: {json.dumps(data, cls=JSONEncoder)}\n\n"
+
+
+@sync_to_async
+def authenticate(request):
+    """JWT from the Authorization header, or ?token= since EventSource cannot set headers"""
+    auth = CachedJWTAuthentication()
+    header = auth.get_header(request)
+    raw_token = auth.get_raw_token(header) if header else request.GET.get('token')
+    if not raw_token:
+        return None
+    try:
+        return auth.get_user(auth.get_validated_token(raw_token))
+    except (InvalidToken, AuthenticationFailed):
+        return None
+
+
+async def event_stream(user):
+    heartbeat = getattr(settings, 'NOTIFICATION_STREAM_HEARTBEAT', 15)
+    subscription = await get_broker().subscribe([user_channel(user.id), BROADCAST_CHANNEL])
+    try:
+        yield 'retry: 5000\n\n'
+        yield format_event('unread_count', {'unread_count': await sync_to_async(unread_count)(user)})
+        while True:
+            try:
+                message = await subscription.get(timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield ': keep-alive\n\n'
+                continue
+            data = message['data']
+            # Broadcasts go to everyone on the channel except whoever triggered them
+            if message['event'] == 'broadcast':
+                if data.get('sender_id') == user.id:
+                    continue
+                yield format_event('notification', data['notification'])
+            else:
+                yield format_event(message['event'], data)
+    finally:
+        await subscription.close()
+
+
+async def notification_stream(request):
+    """
+    Server-sent events for the signed-in user.
+
+    Pushes `notification` (a new personal notification or broadcast),
+    `unread_count` (after notifications are created or read) and `applications`
+    (a change in one of the publisher's jobs' application counts). Each idle
+    connection is only a parked coroutine, so one async worker holds thousands.
+    """
+    user = await authenticate(request)
+    if user is None:
+        return JsonResponse({'detail': 'Authentication credentials were not provided.'}, status=401)
+
+    response = StreamingHttpResponse(event_stream(user), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
@@ -3,35 +3,62 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
-from .models import Notification
+from job_portal.conditional import ConditionalGetMixin, get_version
+from .models import BroadcastNotification, Notification
+from .pagination import NotificationPagination
 from .serializers import NotificationSerializer
+from .services import broadcasts_read_at, mark_broadcasts_read, mark_read, publish_unread_count, unread_count, visible_broadcasts
 
-class NotificationListView(generics.ListAPIView):
+def notification_versions(request):
+    return (get_version('notifications', request.user.id), get_version('broadcasts'))
+
+class NotificationListView(ConditionalGetMixin, generics.ListAPIView):
     serializer_class = NotificationSerializer
     permission_classes = [IsAuthenticated]
-    
+    get_versions = staticmethod(notification_versions)
+
+    pagination_class = NotificationPagination
+
     def get_queryset(self):
-        return Notification.objects.filter(recipient=self.request.user)
+        return Notification.objects.filter(recipient=self.request.user).select_related('sender')
+
+    def list(self, request, *args, **kwargs):
+        # Personal rows and broadcasts are two newest-first streams read with the same cursor
+        broadcasts = visible_broadcasts(request.user).select_related('sender')
+        page = self.paginator.paginate_querysets([self.get_queryset(), broadcasts], request, self)
+
+        read_at = broadcasts_read_at(request.user)
+        for notification in page:
+            if isinstance(notification, BroadcastNotification):
+                notification.is_read = notification.created_at <= read_at
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
 class MarkAsReadView(APIView):
     permission_classes = [IsAuthenticated]
-    
+
     def patch(self, request, pk):
-        notification = get_object_or_404(Notification, id=pk, recipient=request.user)
-        notification.is_read = True
-        notification.save()
+        notification = Notification.objects.filter(id=pk, recipient=request.user).first()
+        if notification is None:
+            # Broadcasts share one high-water mark, so reading one also reads the older ones
+            broadcast = get_object_or_404(BroadcastNotification, id=pk)
+            mark_broadcasts_read(request.user, broadcast.created_at)
+            return Response({'detail': 'Marked as read'})
+        if mark_read(request.user, notification.id):
+            publish_unread_count(request.user)
         return Response({'detail': 'Marked as read'})
 
-class UnreadCountView(APIView):
+class UnreadCountView(ConditionalGetMixin, APIView):
     permission_classes = [IsAuthenticated]
-    
+    get_versions = staticmethod(notification_versions)
+
     def get(self, request):
-        count = Notification.objects.filter(recipient=request.user, is_read=False).count()
-        return Response({'unread_count': count})
+        return Response({'unread_count': unread_count(request.user)})
 
 class MarkAllReadView(APIView):
     permission_classes = [IsAuthenticated]
-    
+
     def post(self, request):
-        Notification.objects.filter(recipient=request.user, is_read=False).update(is_read=True)
-        return Response({'detail': 'All notifications marked as read'})
\ No newline at end of file
+        mark_read(request.user)
+        mark_broadcasts_read(request.user)
+        return Response({'detail': 'All notifications marked as read'})
@@ -3,4 +3,7 @@ from django.apps import AppConfig
 
 class PostsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'posts'
\ No newline at end of file
+    name = 'posts'
+
+    def ready(self):
+        import posts.signals
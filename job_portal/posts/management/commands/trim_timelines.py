@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from posts.timeline import trim_timelines
+
+
+class Command(BaseCommand):
+    help = 'Cut home timelines back to TIMELINE_MAX_LENGTH; run periodically (e.g. hourly from cron)'
+
+    def handle(self, *args, **options):
+        removed = trim_timelines()
+        self.stdout.write(self.style.SUCCESS(f"Removed {removed} timeline entries"))
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.8 on 2026-10-18 18:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def mark_pulled_posts(apps, schema_editor):
+    # Posts of authors over the fan-out limit were only ever read in at read time
+    Post = apps.get_model('posts', 'Post')
+    limit = getattr(settings, 'TIMELINE_FANOUT_MAX_FOLLOWERS', 5000)
+    Post.objects.filter(author__stats__followers_count__gte=limit).update(is_pulled=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0017_userstats'),
+        ('posts', '0010_postimage_variants'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='is_pulled',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_pulled', True)), fields=['-created_at', '-id'], name='post_pulled_idx'),
+        ),
+        migrations.RunPython(mark_pulled_posts, migrations.RunPython.noop),
+    ]
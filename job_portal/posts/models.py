@@ -1,3 +1,5 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
 from django.conf import settings
 from django.utils import timezone
@@ -11,9 +13,24 @@ class Post(models.Model):
     is_active = models.BooleanField(default=True)
     likes_count = models.IntegerField(default=0)
     comments_count = models.IntegerField(default=0)
+    # Set by the post_created handler when the author had too many followers to
+    # fan out to; such posts are merged into timelines at read time for good
+    is_pulled = models.BooleanField(default=False)
+    # Maintained by PostgreSQL on every write; queried by FullTextSearchFilter
+    search_vector = models.GeneratedField(
+        expression=SearchVector('description', config='english'),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            GinIndex(fields=['search_vector'], name='post_search_vector_idx'),
+            models.Index(fields=['-created_at', '-id'], name='post_feed_idx', condition=models.Q(is_active=True)),
+            models.Index(fields=['author', '-created_at', '-id'], name='post_author_feed_idx'),
+            models.Index(fields=['-created_at', '-id'], name='post_pulled_idx', condition=models.Q(is_pulled=True, is_active=True)),
+        ]
 
     def __str__(self):
         return f"Post by {self.author.email} - {self.description[:50]}"
@@ -22,6 +39,7 @@ class Post(models.Model):
 class PostImage(models.Model):
     post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='images')
     image = models.ImageField(upload_to='posts/%Y/%m/%d/')
+    variants = models.JSONField(default=dict, blank=True)  # resized copies, see job_portal.images
     order = models.IntegerField()
     created_at = models.DateTimeField(auto_now_add=True)
 
@@ -66,3 +84,19 @@ class PostShare(models.Model):
     class Meta:
         unique_together = ['post', 'sender', 'recipient']
 
+
+
+class TimelineEntry(models.Model):
+    """A post delivered to a follower's home timeline; written by the post_created outbox handler"""
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='timeline_entries')
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='timeline_entries')
+    # Copied from the post so trimming and unfollow cleanup never join posts
+    author = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='+')
+    created_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = ['user', 'post']
+        indexes = [
+            models.Index(fields=['user', '-created_at', '-id'], name='timeline_entry_user_idx'),
+            models.Index(fields=['user', 'author'], name='timeline_entry_author_idx'),
+        ]
@@ -1,5 +1,7 @@
+from django.core.exceptions import ObjectDoesNotExist
 from rest_framework import serializers
 from authentication.models import User
+from job_portal.images import variant_url
 from .models import Post, PostImage, PostComment
 
 
@@ -11,31 +13,38 @@ class AuthorSerializer(serializers.ModelSerializer):
         fields = ['id', 'first_name', 'last_name', 'job_role', 'avatar_url']
     
     def get_avatar_url(self, obj):
+        # Views select_related both profiles, so a missing one raises here without a query
         try:
             if obj.job_role == 'company':
                 # For company users, get company logo
-                return obj.companyprofile.company_logo.url if obj.companyprofile.company_logo else None
+                profile, image = obj.companyprofile, obj.companyprofile.company_logo
             else:
                 # For individual users, get profile image
-                return obj.userprofile.profile_image.url if obj.userprofile.profile_image else None
-        except:
+                profile, image = obj.userprofile, obj.userprofile.profile_image
+        except ObjectDoesNotExist:
             return None
+        return variant_url(image, profile.variants, 'small')
 
 
 class PostImageSerializer(serializers.ModelSerializer):
     url = serializers.SerializerMethodField()
+    original_url = serializers.SerializerMethodField()
     
     class Meta:
         model = PostImage
-        fields = ['id', 'url']
+        fields = ['id', 'url', 'original_url']
     
     def get_url(self, obj):
+        # PostSerializer asks for grid thumbnails when a post has several images
+        return variant_url(obj.image, obj.variants, self.context.get('image_variant', 'large'))
+    
+    def get_original_url(self, obj):
         return obj.image.url if obj.image else None
 
 
 class PostSerializer(serializers.ModelSerializer):
     author = AuthorSerializer(read_only=True)
-    images = PostImageSerializer(many=True, read_only=True)
+    images = serializers.SerializerMethodField()
     is_owner = serializers.SerializerMethodField()
     liked = serializers.SerializerMethodField()
     
@@ -44,11 +53,18 @@ class PostSerializer(serializers.ModelSerializer):
         fields = ['id', 'author', 'description', 'images', 'likes_count', 'comments_count', 'liked', 'created_at', 'updated_at', 'is_owner']
         read_only_fields = ['author', 'created_at', 'updated_at', 'likes_count', 'comments_count']
     
+    def get_images(self, obj):
+        images = obj.images.all()
+        context = {**self.context, 'image_variant': 'large' if len(images) == 1 else 'thumb'}
+        return PostImageSerializer(images, many=True, context=context).data
+    
     def get_is_owner(self, obj):
         request = self.context.get('request')
         return request and request.user == obj.author
     
     def get_liked(self, obj):
+        if hasattr(obj, 'is_liked'):
+            return obj.is_liked
         request = self.context.get('request')
         if request and request.user.is_authenticated:
             return obj.likes.filter(user=request.user).exists()
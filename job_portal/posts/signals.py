@@ -0,0 +1,59 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from home.follow_models import Follow, follow_requests_resolved
+from home.models import CompanyProfile, UserProfile
+from job_portal.conditional import bump_version
+from job_portal.images import queue_variants
+from notifications.services import enqueue_event
+from .models import Post, PostComment, PostImage, PostLike
+from .timeline import backfill_timeline, backfill_timelines, remove_from_timeline
+
+
+# Everything PostSerializer renders in the feed, including the author avatars
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=PostImage)
+@receiver(post_delete, sender=PostImage)
+@receiver(post_save, sender=PostLike)
+@receiver(post_delete, sender=PostLike)
+@receiver(post_save, sender=PostComment)
+@receiver(post_delete, sender=PostComment)
+@receiver(post_save, sender=UserProfile)
+@receiver(post_save, sender=CompanyProfile)
+def feed_changed(sender, **kwargs):
+    bump_version('posts')
+
+
+@receiver(post_save, sender=Post)
+def deliver_post(sender, instance, created, **kwargs):
+    if created and instance.is_active:
+        enqueue_event('post_created', post_id=instance.id)
+
+
+@receiver(post_save, sender=Follow)
+def sync_timeline_on_follow(sender, instance, **kwargs):
+    # _previous_status is recorded by home.signals.remember_follow_status
+    was_accepted = getattr(instance, '_previous_status', None) == 'accepted'
+    is_accepted = instance.status == 'accepted'
+    if is_accepted and not was_accepted:
+        backfill_timeline(instance.follower_id, instance.following_id)
+    elif was_accepted and not is_accepted:
+        remove_from_timeline(instance.follower_id, instance.following_id)
+
+
+@receiver(post_delete, sender=Follow)
+def sync_timeline_on_unfollow(sender, instance, **kwargs):
+    # Pending requests never had entries; skipping them keeps bulk rejects to one query
+    if instance.status == 'accepted':
+        remove_from_timeline(instance.follower_id, instance.following_id)
+
+
+@receiver(follow_requests_resolved)
+def sync_timelines_on_bulk_accept(sender, following, follower_ids, accepted, **kwargs):
+    if accepted:
+        backfill_timelines(follower_ids, following.id)
+
+
+@receiver(post_save, sender=PostImage)
+def resize_post_image(sender, instance, **kwargs):
+    queue_variants(instance, 'image', 'post')
@@ -0,0 +1,113 @@
+from django.conf import settings
+from django.db.models import F, Q
+from home.follow_models import Follow
+from home.models import UserStats
+from .models import Post, TimelineEntry
+
+
+def fanout_limit():
+    return getattr(settings, 'TIMELINE_FANOUT_MAX_FOLLOWERS', 5000)
+
+
+def is_fanned_out(author_id):
+    """Whether a new post by the author is written to follower timelines; above the limit it is read in instead"""
+    followers = UserStats.objects.filter(user_id=author_id).values_list('followers_count', flat=True).first() or 0
+    return followers < fanout_limit()
+
+
+def count_timeline_entries(user_ids, delta):
+    UserStats.objects.filter(user_id__in=user_ids).update(timeline_length=F('timeline_length') + delta)
+
+
+def fan_out_post(event):
+    """Outbox handler for post_created: deliver the post to the author and their accepted followers.
+
+    The choice is recorded on the post, so a post is either delivered or pulled
+    for its whole life, whichever side of the follower limit its author later
+    moves to.
+    """
+    post = Post.objects.filter(id=event.payload['post_id'], is_active=True).first()
+    if post is None:
+        return
+    user_ids = [post.author_id]
+    if is_fanned_out(post.author_id):
+        user_ids += Follow.objects.filter(following_id=post.author_id, status='accepted').values_list('follower_id', flat=True)
+    else:
+        Post.objects.filter(id=post.id).update(is_pulled=True)
+
+    batch_size = getattr(settings, 'TIMELINE_FANOUT_BATCH_SIZE', 1000)
+    for start in range(0, len(user_ids), batch_size):
+        batch = user_ids[start:start + batch_size]
+        TimelineEntry.objects.bulk_create(
+            [TimelineEntry(user_id=user_id, post=post, author_id=post.author_id, created_at=post.created_at) for user_id in batch],
+            ignore_conflicts=True,
+        )
+        count_timeline_entries(batch, 1)
+
+
+def trim_timelines():
+    """Maintenance job: cut timelines back to TIMELINE_MAX_LENGTH once they overshoot it by TIMELINE_TRIM_SLACK.
+
+    Fan-out never trims, so delivering a post stays a plain insert. The
+    timeline_length counters kept on UserStats as entries are delivered point at
+    the timelines that may be too long; each is cut below the entry at position
+    TIMELINE_MAX_LENGTH, read from the (user, -created_at, -id) index, and its
+    counter corrected. Returns the number of entries removed.
+    """
+    max_length = getattr(settings, 'TIMELINE_MAX_LENGTH', 800)
+    slack = getattr(settings, 'TIMELINE_TRIM_SLACK', 50)
+    candidates = UserStats.objects.filter(timeline_length__gt=max_length + slack).values_list('user_id', flat=True)
+    removed = 0
+    for user_id in list(candidates):
+        entries = TimelineEntry.objects.filter(user_id=user_id)
+        cutoff = entries.order_by('-created_at', '-id').values_list('created_at', 'id')[max_length:max_length + 1]
+        stats = UserStats.objects.filter(user_id=user_id)
+        for created_at, entry_id in cutoff:
+            cut = entries.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, id__lte=entry_id)
+            ).delete()[0]
+            # Relative, so entries delivered meanwhile stay counted
+            stats.update(timeline_length=F('timeline_length') - cut)
+            removed += cut
+        if not cutoff:
+            # Unfollows removed entries without counting them down; the timeline is short enough
+            stats.update(timeline_length=entries.count())
+    return removed
+
+
+def backfill_timeline(follower_id, author_id):
+    """Copy an author's recent posts into a new follower's timeline"""
+    backfill_timelines([follower_id], author_id)
+
+
+def backfill_timelines(follower_ids, author_id):
+    """Copy an author's recent posts into the timelines of several new followers with one insert per batch.
+
+    Pulled posts are left out; timeline_querysets reads those in for every follower.
+    """
+    recent = Post.objects.filter(author_id=author_id, is_active=True, is_pulled=False).order_by('-created_at', '-id')
+    recent = list(recent.values_list('id', 'created_at')[:getattr(settings, 'TIMELINE_BACKFILL', 20)])
+    if not recent:
+        return
+    TimelineEntry.objects.bulk_create(
+        [
+            TimelineEntry(user_id=follower_id, post_id=post_id, author_id=author_id, created_at=created_at)
+            for follower_id in follower_ids
+            for post_id, created_at in recent
+        ],
+        batch_size=getattr(settings, 'TIMELINE_FANOUT_BATCH_SIZE', 1000),
+        ignore_conflicts=True,
+    )
+    count_timeline_entries(follower_ids, len(recent))
+
+
+def remove_from_timeline(follower_id, author_id):
+    TimelineEntry.objects.filter(user_id=follower_id, author_id=author_id).delete()
+
+
+def timeline_querysets(user):
+    """The user's home timeline as newest-first post querysets to merge: delivered posts and pulled posts of followees"""
+    delivered = Post.objects.filter(timeline_entries__user=user, is_active=True)
+    followees = Follow.objects.filter(follower=user, status='accepted').values('following_id')
+    pulled = Post.objects.filter(is_pulled=True, is_active=True, author__in=followees)
+    return [delivered, pulled]
@@ -2,11 +2,12 @@ from django.urls import path
 from .views import (
     PostListCreateView, PostDetailView, PostImageAddView, PostImageDeleteView, 
     PostLikeView, PostUnlikeView, PostCommentListCreateView, CommentDeleteView,
-    UserListView, PostShareView, NotificationListView
+    UserListView, PostShareView, TimelineView
 )
 
 urlpatterns = [
     path('posts/', PostListCreateView.as_view(), name='post-list-create'),
+    path('posts/timeline/', TimelineView.as_view(), name='post-timeline'),
     path('posts/<int:pk>/', PostDetailView.as_view(), name='post-detail'),
     path('posts/<int:post_id>/images/', PostImageAddView.as_view(), name='post-image-add'),
     path('posts/<int:post_id>/images/<int:img_id>/', PostImageDeleteView.as_view(), name='post-image-delete'),
@@ -16,5 +17,4 @@ urlpatterns = [
     path('posts/<int:post_id>/share/', PostShareView.as_view(), name='post-share'),
     path('comments/<int:comment_id>/', CommentDeleteView.as_view(), name='comment-delete'),
     path('users/', UserListView.as_view(), name='user-list'),
-    path('notifications/', NotificationListView.as_view(), name='notifications'),
 ]
\ No newline at end of file
@@ -2,25 +2,42 @@ from rest_framework import generics, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.filters import SearchFilter, OrderingFilter
 from django.shortcuts import get_object_or_404
 from django.db import transaction, models
 from authentication.models import User
+from job_portal.conditional import ConditionalGetMixin, get_version
+from job_portal.search import FullTextSearchFilter
 from notifications.models import Notification
 from .models import Post, PostImage, PostLike, PostComment, PostShare
 from .serializers import PostSerializer, PostCreateSerializer, ImageAddSerializer, PostCommentSerializer, UserListSerializer
+from .pagination import FeedPagination
+from .timeline import timeline_querysets
 from .permissions import IsAuthorOrReadOnly
 
 
-class PostListCreateView(generics.ListCreateAPIView):
-    queryset = Post.objects.filter(is_active=True).select_related('author').prefetch_related('images')
+# Both profile joins, so AuthorSerializer can pick the avatar without a query per author
+AUTHOR_PROFILES = ('author__userprofile', 'author__companyprofile')
+
+
+def with_liked(queryset, user):
+    """Annotate whether `user` liked each post, so the serializer needs no query per row"""
+    return queryset.annotate(
+        is_liked=models.Exists(PostLike.objects.filter(post=models.OuterRef('pk'), user=user))
+    )
+
+
+class PostListCreateView(ConditionalGetMixin, generics.ListCreateAPIView):
+    queryset = Post.objects.filter(is_active=True).select_related(*AUTHOR_PROFILES).prefetch_related('images')
     permission_classes = [IsAuthenticated]
-    filter_backends = [SearchFilter, OrderingFilter]
-    search_fields = ['description', 'author__first_name', 'author__last_name']
-    ordering = ['-created_at']
+    pagination_class = FeedPagination
+    filter_backends = [FullTextSearchFilter]
+    search_person_field = 'author'
+    
+    def get_versions(self, request):
+        return (get_version('posts'),)
     
     def get_queryset(self):
-        queryset = super().get_queryset()
+        queryset = with_liked(super().get_queryset(), self.request.user)
         if self.request.query_params.get('my_posts') == 'true':
             queryset = queryset.filter(author=self.request.user)
         return queryset
@@ -42,20 +59,31 @@ class PostListCreateView(generics.ListCreateAPIView):
                 return Response({'detail': 'Post created successfully'}, status=status.HTTP_201_CREATED)
         except Exception as e:
             return Response({'detail': 'Failed to create post'}, status=status.HTTP_400_BAD_REQUEST)
-    
+
+
+class TimelineView(generics.ListAPIView):
+    """Home timeline: the user's own posts and posts from accounts they follow"""
+    serializer_class = PostSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = FeedPagination
+
     def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return Response({
-            'total_count': queryset.count(),
-            'results': serializer.data
-        })
+        querysets = [
+            with_liked(queryset, request.user).select_related(*AUTHOR_PROFILES).prefetch_related('images')
+            for queryset in timeline_querysets(request.user)
+        ]
+        page = self.paginator.paginate_querysets(querysets, request, self)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
 
 class PostDetailView(generics.RetrieveUpdateDestroyAPIView):
-    queryset = Post.objects.filter(is_active=True).select_related('author').prefetch_related('images')
+    queryset = Post.objects.filter(is_active=True).select_related(*AUTHOR_PROFILES).prefetch_related('images')
     permission_classes = [IsAuthenticated, IsAuthorOrReadOnly]
     
+    def get_queryset(self):
+        return with_liked(super().get_queryset(), self.request.user)
+    
     def get_serializer_class(self):
         if self.request.method in ['PUT', 'PATCH']:
             return PostCreateSerializer
@@ -183,7 +211,7 @@ class PostCommentListCreateView(generics.ListCreateAPIView):
     
     def get_queryset(self):
         post_id = self.kwargs['post_id']
-        return PostComment.objects.filter(post_id=post_id, is_active=True).select_related('user')
+        return PostComment.objects.filter(post_id=post_id, is_active=True).select_related('user__userprofile', 'user__companyprofile')
     
     def perform_create(self, serializer):
         post_id = self.kwargs['post_id']
@@ -274,23 +302,3 @@ class PostShareView(APIView):
             'detail': f'Post shared with {shared_count} users',
             'shared_count': shared_count
         }, status=status.HTTP_200_OK)
-
-
-class NotificationListView(APIView):
-    permission_classes = [IsAuthenticated]
-    
-    def get(self, request):
-        notifications = Notification.objects.filter(recipient=request.user)
-        # Simple serialization since we're not using the NotificationSerializer
-        data = [{
-            'id': str(n.id),
-            'sender_name': f'{n.sender.first_name} {n.sender.last_name}' if n.sender else 'System',
-            'message': n.message,
-            'notification_type': n.notification_type,
-            'is_read': n.is_read,
-            'created_at': n.created_at,
-            'object_id': str(n.object_id) if n.object_id else None
-        } for n in notifications]
-        return Response(data)
-
-
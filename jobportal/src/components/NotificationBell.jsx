@@ -6,6 +6,8 @@ const NotificationBell = () => {
   const [unreadCount, setUnreadCount] = useState(0);
   const [notifications, setNotifications] = useState([]);
   const [showDropdown, setShowDropdown] = useState(false);
+  const [nextPage, setNextPage] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     fetchUnreadCount();
@@ -24,12 +26,30 @@ const NotificationBell = () => {
   const fetchNotifications = async () => {
     try {
       const response = await notificationService.getNotifications();
-      setNotifications(response.data.results || response.data);
+      setNotifications(response.data.results);
+      setNextPage(response.data.next);
     } catch (error) {
       console.error('Error fetching notifications:', error);
     }
   };
 
+  const loadMoreNotifications = async () => {
+    if (!nextPage || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      const response = await notificationService.getNotificationsPage(nextPage);
+      setNotifications(prev => {
+        const seen = new Set(prev.map(notif => notif.id));
+        return [...prev, ...response.data.results.filter(notif => !seen.has(notif.id))];
+      });
+      setNextPage(response.data.next);
+    } catch (error) {
+      console.error('Error loading more notifications:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const markAsRead = async (id) => {
     try {
       await notificationService.markAsRead(id);
@@ -83,7 +103,7 @@ const NotificationBell = () => {
             {notifications.length === 0 ? (
               <p className="no-notifications">No notifications</p>
             ) : (
-              notifications.slice(0, 10).map(notification => (
+              notifications.map(notification => (
                 <div 
                   key={notification.id}
                   className={`notification-item ${!notification.is_read ? 'unread' : ''}`}
@@ -99,6 +119,11 @@ const NotificationBell = () => {
                 </div>
               ))
             )}
+            {nextPage && (
+              <button onClick={loadMoreNotifications} className="mark-all-btn" disabled={loadingMore}>
+                {loadingMore ? 'Loading...' : 'Load more'}
+              </button>
+            )}
           </div>
         </div>
       )}
@@ -25,6 +25,8 @@ export default function Home() {
   const [errors, setErrors] = useState({});
   const [changePasswordLoading, setChangePasswordLoading] = useState(false);
   const [posts, setPosts] = useState([]);
+  const [nextPage, setNextPage] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [openMenuId, setOpenMenuId] = useState(null);
   const [editingPost, setEditingPost] = useState(null);
   const [editContent, setEditContent] = useState('');
@@ -49,6 +51,7 @@ export default function Home() {
         ]);
         setUser(userData);
         setPosts(postsData.results || []);
+        setNextPage(postsData.next || null);
         
         // Load following data and stats
         if (userData.id) {
@@ -85,6 +88,23 @@ export default function Home() {
     }
   };
 
+  const loadMorePosts = async () => {
+    if (!nextPage || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      const postsData = await postsAPI.getPostsPage(nextPage);
+      setPosts(prev => {
+        const seen = new Set(prev.map(post => post.id));
+        return [...prev, ...(postsData.results || []).filter(post => !seen.has(post.id))];
+      });
+      setNextPage(postsData.next || null);
+    } catch (error) {
+      console.error('Failed to load more posts:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const formatTimeAgo = (dateString) => {
     const now = new Date();
     const postDate = new Date(dateString);
@@ -145,6 +165,7 @@ export default function Home() {
       
       const postsData = await postsAPI.getPosts();
       setPosts(postsData.results || []);
+      setNextPage(postsData.next || null);
     } catch (error) {
       console.error('Failed to add comment:', error);
     }
@@ -179,6 +200,7 @@ export default function Home() {
     
     setChangePasswordLoading(true);
     try {
+      // Stores the new token pair; the old one stops working once the password changes
       await authAPI.changePassword(changePasswordForm.oldPassword, changePasswordForm.newPassword);
       alert("Password changed successfully!");
       setShowChangePassword(false);
@@ -627,7 +649,13 @@ export default function Home() {
                         );
                       })}
 
-
+                    {nextPage && (
+                      <div className="load-more-posts">
+                        <button onClick={loadMorePosts} className="post-btn" disabled={loadingMore}>
+                          {loadingMore ? 'Loading...' : 'Load more'}
+                        </button>
+                      </div>
+                    )}
 
                   </div>
                   
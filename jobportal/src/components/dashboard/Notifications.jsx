@@ -7,16 +7,36 @@ export default function Notifications({ onNavigateToPost }) {
   const [loading, setLoading] = useState(true);
   const [filter, setFilter] = useState('all');
   const [unreadCount, setUnreadCount] = useState(0);
+  const [nextPage, setNextPage] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     fetchNotifications();
     fetchUnreadCount();
   }, []);
 
+  // Live updates: new or re-aggregated notifications and the badge count
+  useEffect(() => {
+    const stream = notificationService.openStream();
+    stream.addEventListener('unread_count', (e) => {
+      setUnreadCount(JSON.parse(e.data).unread_count);
+    });
+    stream.addEventListener('notification', (e) => {
+      const notification = JSON.parse(e.data);
+      setNotifications(prev => [notification, ...prev.filter(notif => notif.id !== notification.id)]);
+      // Job posts are broadcasts, which arrive without an unread_count event of their own
+      if (notification.notification_type === 'job') {
+        setUnreadCount(count => count + 1);
+      }
+    });
+    return () => stream.close();
+  }, []);
+
   const fetchNotifications = async () => {
     try {
       const response = await notificationService.getNotifications();
-      setNotifications(response.data.results || response.data);
+      setNotifications(response.data.results);
+      setNextPage(response.data.next);
     } catch (error) {
       console.error('Error fetching notifications:', error);
     } finally {
@@ -24,6 +44,23 @@ export default function Notifications({ onNavigateToPost }) {
     }
   };
 
+  const loadMoreNotifications = async () => {
+    if (!nextPage || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      const response = await notificationService.getNotificationsPage(nextPage);
+      setNotifications(prev => {
+        const seen = new Set(prev.map(notif => notif.id));
+        return [...prev, ...response.data.results.filter(notif => !seen.has(notif.id))];
+      });
+      setNextPage(response.data.next);
+    } catch (error) {
+      console.error('Error loading more notifications:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const fetchUnreadCount = async () => {
     try {
       const response = await notificationService.getUnreadCount();
@@ -147,7 +184,7 @@ export default function Notifications({ onNavigateToPost }) {
           className={`filter-btn ${filter === 'read' ? 'active' : ''}`}
           onClick={() => setFilter('read')}
         >
-          Read ({notifications.length - unreadCount})
+          Read ({notifications.filter(notif => notif.is_read).length})
         </button>
       </div>
 
@@ -193,6 +230,13 @@ export default function Notifications({ onNavigateToPost }) {
             </div>
           ))
         )}
+        {nextPage && (
+          <div className="load-more">
+            <button className="mark-all-btn" onClick={loadMoreNotifications} disabled={loadingMore}>
+              {loadingMore ? 'Loading...' : 'Load more'}
+            </button>
+          </div>
+        )}
       </div>
     </div>
   );
@@ -6,6 +6,9 @@ export default function Network({ user }) {
   const [activeTab, setActiveTab] = useState('suggestions');
   const [searchTerm, setSearchTerm] = useState('');
   const [users, setUsers] = useState([]);
+  const [usersNext, setUsersNext] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [requestedSet, setRequestedSet] = useState(new Set());
   const [followers, setFollowers] = useState([]);
   const [following, setFollowing] = useState([]);
   const [followRequests, setFollowRequests] = useState([]);
@@ -28,10 +31,6 @@ export default function Network({ user }) {
       setLoading(true);
       setError(null);
       
-      // Get users data
-      const usersData = await networkService.getAllUsers();
-      setUsers(usersData);
-      
       // Get stats and following data if user is available
       if (user?.id) {
         try {
@@ -90,6 +89,20 @@ export default function Network({ user }) {
     }
   };
 
+  const loadMoreUsers = async () => {
+    if (!usersNext || loadingMore) return;
+    try {
+      setLoadingMore(true);
+      const data = await networkService.getUsersPage(usersNext);
+      setUsers(prev => [...prev, ...data.results]);
+      setUsersNext(data.next);
+    } catch (error) {
+      console.error('Error loading more users:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const loadFollowRequests = async () => {
     try {
       const data = await networkService.getFollowRequests();
@@ -113,6 +126,30 @@ export default function Network({ user }) {
     }
   }, [activeTab, currentUser]);
 
+  // The directory is searched on the server so every page is reachable, not just the first
+  useEffect(() => {
+    if (activeTab !== 'people') return;
+    let stale = false;
+    // Wait for a pause in typing before asking the server
+    const timer = setTimeout(async () => {
+      try {
+        const search = searchTerm.trim();
+        const data = await networkService.getAllUsers(search ? { search } : {});
+        // Drop answers to searches the user has already typed past
+        if (!stale) {
+          setUsers(data.results);
+          setUsersNext(data.next);
+        }
+      } catch (error) {
+        console.error('Error loading users:', error);
+      }
+    }, 300);
+    return () => {
+      stale = true;
+      clearTimeout(timer);
+    };
+  }, [activeTab, searchTerm]);
+
   const handleAcceptRequest = async (userId) => {
     try {
       await networkService.acceptFollowRequest(userId);
@@ -142,6 +179,16 @@ export default function Network({ user }) {
     }
   };
 
+  const handleFollow = async (userId) => {
+    try {
+      await networkService.followUser(userId);
+      setRequestedSet(prev => new Set(prev).add(userId));
+    } catch (error) {
+      console.error('Error following user:', error);
+      alert(error.response?.data?.detail || 'An error occurred');
+    }
+  };
+
   const handleUnfollow = async (userId) => {
     try {
       await networkService.unfollowUser(userId);
@@ -161,7 +208,10 @@ export default function Network({ user }) {
   const getFilteredUsers = () => {
     let filtered = [];
     
-    if (activeTab === 'suggestions') {
+    if (activeTab === 'people') {
+      // Already filtered by the server
+      return users.filter(u => u.id !== currentUser?.id);
+    } else if (activeTab === 'suggestions') {
       filtered = followRequests;
     } else if (activeTab === 'following') {
       filtered = following;
@@ -218,6 +268,12 @@ export default function Network({ user }) {
 
       {/* Navigation Tabs */}
       <div className="network-tabs">
+        <button 
+          className={`tab-btn ${activeTab === 'people' ? 'active' : ''}`}
+          onClick={() => setActiveTab('people')}
+        >
+          People
+        </button>
         <button 
           className={`tab-btn ${activeTab === 'suggestions' ? 'active' : ''}`}
           onClick={() => setActiveTab('suggestions')}
@@ -282,6 +338,24 @@ export default function Network({ user }) {
                 </div>
 
                 <div className="user-actions">
+                  {activeTab === 'people' && (
+                    followingSet.has(user.id) ? (
+                      <button 
+                        className="unfollow-btn"
+                        onClick={() => handleUnfollow(user.id)}
+                      >
+                        Unfollow
+                      </button>
+                    ) : (
+                      <button 
+                        className="follow-btn"
+                        onClick={() => handleFollow(user.id)}
+                        disabled={requestedSet.has(user.id)}
+                      >
+                        {requestedSet.has(user.id) ? 'Requested' : 'Follow'}
+                      </button>
+                    )
+                  )}
                   {activeTab === 'suggestions' && (
                     <>
                       <button 
@@ -318,6 +392,14 @@ export default function Network({ user }) {
         </div>
       )}
 
+      {!loading && activeTab === 'people' && usersNext && (
+        <div className="load-more">
+          <button onClick={loadMoreUsers} className="retry-btn" disabled={loadingMore}>
+            {loadingMore ? 'Loading...' : 'Load more'}
+          </button>
+        </div>
+      )}
+
       {!loading && getFilteredUsers().length === 0 && (
         <div className="empty-state">
           <h3>No users found</h3>
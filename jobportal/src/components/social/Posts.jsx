@@ -9,6 +9,8 @@ export default function Posts({ user }) {
   const [lightbox, setLightbox] = useState({ show: false, images: [], currentIndex: 0 });
   const [loading, setLoading] = useState(false);
   const [posts, setPosts] = useState([]);
+  const [nextPage, setNextPage] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [openMenuId, setOpenMenuId] = useState(null);
   const [editingPost, setEditingPost] = useState(null);
   const [editContent, setEditContent] = useState('');
@@ -29,6 +31,7 @@ export default function Posts({ user }) {
       try {
         const postsData = await postsAPI.getPosts(true);
         setPosts(postsData.results || []);
+        setNextPage(postsData.next || null);
       } catch (error) {
         console.error('Failed to fetch posts:', error);
       }
@@ -94,6 +97,7 @@ export default function Posts({ user }) {
       // Refresh my posts
       const postsData = await postsAPI.getPosts(true);
       setPosts(postsData.results || []);
+      setNextPage(postsData.next || null);
       
       setPostText("");
       setSelectedImages([]);
@@ -105,6 +109,23 @@ export default function Posts({ user }) {
     }
   };
 
+  const loadMorePosts = async () => {
+    if (!nextPage || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      const postsData = await postsAPI.getPostsPage(nextPage);
+      setPosts(prev => {
+        const seen = new Set(prev.map(post => post.id));
+        return [...prev, ...(postsData.results || []).filter(post => !seen.has(post.id))];
+      });
+      setNextPage(postsData.next || null);
+    } catch (error) {
+      console.error('Failed to load more posts:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const formatTimeAgo = (dateString) => {
     const now = new Date();
     const postDate = new Date(dateString);
@@ -168,6 +189,7 @@ export default function Posts({ user }) {
       // Refresh posts
       const postsData = await postsAPI.getPosts(true);
       setPosts(postsData.results || []);
+      setNextPage(postsData.next || null);
       
       setEditingPost(null);
       setEditContent('');
@@ -209,6 +231,7 @@ export default function Posts({ user }) {
       // Refresh posts
       const postsData = await postsAPI.getPosts(true);
       setPosts(postsData.results || []);
+      setNextPage(postsData.next || null);
     } catch (error) {
       console.error('Failed to delete image:', error);
       alert('Failed to delete image');
@@ -225,6 +248,7 @@ export default function Posts({ user }) {
       // Refresh posts
       const postsData = await postsAPI.getPosts(true);
       setPosts(postsData.results || []);
+      setNextPage(postsData.next || null);
       setOpenMenuId(null);
     } catch (error) {
       console.error('Failed to add images:', error);
@@ -249,6 +273,7 @@ export default function Posts({ user }) {
       // Refresh posts to get updated counts
       const postsData = await postsAPI.getPosts(true);
       setPosts(postsData.results || []);
+      setNextPage(postsData.next || null);
     } catch (error) {
       console.error('Failed to like/unlike post:', error);
     }
@@ -287,6 +312,7 @@ export default function Posts({ user }) {
       await loadComments(postId);
       const postsData = await postsAPI.getPosts(true);
       setPosts(postsData.results || []);
+      setNextPage(postsData.next || null);
     } catch (error) {
       console.error('Failed to add comment:', error);
     }
@@ -300,6 +326,7 @@ export default function Posts({ user }) {
       // Refresh posts to update comment count
       const postsData = await postsAPI.getPosts(true);
       setPosts(postsData.results || []);
+      setNextPage(postsData.next || null);
     } catch (error) {
       console.error('Failed to delete comment:', error);
     }
@@ -599,6 +626,13 @@ export default function Posts({ user }) {
             </div>
           );
         })}
+        {nextPage && (
+          <div className="load-more-posts">
+            <button onClick={loadMorePosts} className="post-btn" disabled={loadingMore}>
+              {loadingMore ? 'Loading...' : 'Load more'}
+            </button>
+          </div>
+        )}
       </div>
       
       {editingPost && (
@@ -166,6 +166,17 @@ export const postsAPI = {
     }, API_BASE_URL);
   },
 
+  // Follow the `next` link of a feed page; it is already an absolute URL carrying the cursor
+  getPostsPage: (nextUrl) => {
+    const token = localStorage.getItem('access_token');
+    return apiCall(nextUrl, {
+      method: 'GET',
+      headers: {
+        'Authorization': `Bearer ${token}`,
+      },
+    }, '');
+  },
+
   createPost: (postData) => {
     const token = localStorage.getItem('access_token');
     return apiCall('/posts/', {
@@ -363,9 +374,9 @@ export const authAPI = {
     }, 'http://localhost:8000/api/home');
   },
 
-  changePassword: (oldPassword, newPassword) => {
+  changePassword: async (oldPassword, newPassword) => {
     const token = localStorage.getItem('access_token');
-    return apiCall('/change-password/', {
+    const response = await apiCall('/change-password/', {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -377,6 +388,10 @@ export const authAPI = {
         confirm_password: newPassword 
       }),
     });
+    // Changing the password revokes every earlier token, this session's included
+    localStorage.setItem('access_token', response.access);
+    localStorage.setItem('refresh_token', response.refresh);
+    return response;
   },
 
   deleteProfileImage: () => {
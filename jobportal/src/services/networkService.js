@@ -1,9 +1,15 @@
 import api from './apiClient';
 
 export const networkService = {
-  // Get all users
-  getAllUsers: async () => {
-    const response = await api.get('/home/users/');
+  // Get one page of the user directory ({ results, next }); pass { search, page_size } to narrow it
+  getAllUsers: async (params = {}) => {
+    const response = await api.get('/home/users/', { params });
+    return response.data;
+  },
+
+  // Get the page after one returned by getAllUsers, following its `next` link
+  getUsersPage: async (nextUrl) => {
+    const response = await api.get(nextUrl);
     return response.data;
   },
 
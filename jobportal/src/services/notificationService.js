@@ -17,7 +17,13 @@ api.interceptors.request.use((config) => {
 
 export const notificationService = {
   getNotifications: () => api.get('/notifications/'),
+  // Follow the `next` link of a notification page (an absolute URL carrying the cursor)
+  getNotificationsPage: (nextUrl) => api.get(nextUrl),
   getUnreadCount: () => api.get('/notifications/unread-count/'),
   markAsRead: (id) => api.patch(`/notifications/${id}/read/`),
   markAllAsRead: () => api.post('/notifications/mark-all-read/'),
+  // Server-sent events; EventSource cannot set headers, so the token goes in the query string
+  openStream: () => new EventSource(
+    `${API_BASE_URL}/notifications/stream/?token=${encodeURIComponent(localStorage.getItem('access_token') || '')}`
+  ),
 };
\ No newline at end of file